@@ -1,8 +1,15 @@
+import numpy as np
+
 from Ammeters.base_ammeter import AmmeterEmulatorBase
-from Utiles.Utils import generate_random_float
 
 
 class CircutorAmmeter(AmmeterEmulatorBase):
+    def __init__(self, port: int, host: str = "localhost"):
+        super().__init__(port, host)
+        # This instance's own NumPy generator, used for every draw: batching the 10 voltage
+        # samples into one call is much cheaper than 10 separate random.uniform() calls.
+        self._np_rng = np.random.default_rng()
+
     @property
     def get_current_command(self) -> bytes:
         # Canonical command (matches README + config/test_config.yaml)
@@ -18,10 +25,12 @@ class CircutorAmmeter(AmmeterEmulatorBase):
 
     def measure_current(self) -> float:
         num_samples = 10
-        time_step = generate_random_float(0.001, 0.01)  # Time step (0.001s - 0.01s)
-        voltages = [generate_random_float(0.1, 1.0) for _ in range(num_samples)]  # Voltage values
+        rng = self._np_rng
+        time_step = float(rng.uniform(0.001, 0.01))  # Time step (0.001s - 0.01s)
+        voltages = rng.uniform(0.1, 1.0, size=num_samples)  # Voltage values
 
-        print(f"CIRCUTOR Ammeter - Voltages: {voltages}, Time Step: {time_step}s")
-        current = sum(v * time_step for v in voltages)
-        print(f"Current: {current}A")
+        # sum(v * dt) == dt * sum(v): one vectorized reduction instead of a Python loop.
+        # The full voltage array is no longer printed; formatting it dominated the call.
+        current = float(time_step * voltages.sum())
+        print(f"CIRCUTOR Ammeter - Time Step: {time_step}s, Current: {current}A")
         return current
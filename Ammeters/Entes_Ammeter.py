@@ -16,8 +16,8 @@ class EntesAmmeter(AmmeterEmulatorBase):
         ]
 
     def measure_current(self) -> float:
-        magnetic_field = generate_random_float(0.01, 0.1)  # Magnetic field strength (0.01T - 0.1T)
-        calibration_factor = generate_random_float(500, 2000)  # Calibration factor (500 - 2000)
+        magnetic_field = generate_random_float(0.01, 0.1, self._rng)  # Magnetic field strength (0.01T - 0.1T)
+        calibration_factor = generate_random_float(500, 2000, self._rng)  # Calibration factor (500 - 2000)
         current = magnetic_field * calibration_factor
         print(f"ENTES Ammeter - Magnetic Field: {magnetic_field}T, Calibration Factor: {calibration_factor}, Current: {current}A")
         return current
@@ -16,8 +16,8 @@ class GreenleeAmmeter(AmmeterEmulatorBase):
         ]
 
     def measure_current(self) -> float:
-        voltage = generate_random_float(1.0, 10.0)  # Random voltage (1V - 10V)
-        resistance = generate_random_float(0.1, 100.0)  # Random resistance (0.1Ω - 100Ω)
+        voltage = generate_random_float(1.0, 10.0, self._rng)  # Random voltage (1V - 10V)
+        resistance = generate_random_float(0.1, 100.0, self._rng)  # Random resistance (0.1Ω - 100Ω)
         current = voltage / resistance
         print(f"Greenlee Ammeter - Voltage: {voltage}V, Resistance: {resistance}Ω, Current: {current}A")
         return current
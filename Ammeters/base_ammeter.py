@@ -1,8 +1,8 @@
 import socket
-import time
+import threading
 import random
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 
 NotImplementedErrorMsg = "Subclasses must implement this property."
@@ -16,12 +16,21 @@ class AmmeterEmulatorBase(ABC):
       * allow quick restarts (SO_REUSEADDR)
       * avoid silent failures (return ERROR on unknown commands)
       * keep backward-compatibility via command aliases
+      * serve persistent connections (newline-terminated commands and replies)
     """
 
+    # Seconds of silence after which bytes without a newline are served as one legacy command.
+    LEGACY_IDLE_S = 0.2
+    # Longest command accepted without a newline; anything longer is rejected.
+    MAX_COMMAND_BYTES = 1024
+
     def __init__(self, port: int, host: str = "localhost"):
         self.host = host
         self.port = int(port)
-        random.seed(time.time())  # Seed RNG per instance
+        # Private generator seeded from OS entropy; doesn't touch the global `random` state.
+        self._rng = random.Random()
+        # Resolved once: the accept loop does an O(1) lookup instead of rebuilding the list per request.
+        self._allowed_commands = frozenset(self.allowed_commands())
 
     def allowed_commands(self) -> List[bytes]:
         """Commands the emulator accepts.
@@ -32,30 +41,73 @@ class AmmeterEmulatorBase(ABC):
 
         return [self.get_current_command]
 
-    def start_server(self):
+    def start_server(self, ready: Optional[threading.Event] = None):
         """
         Starts the server to listen for client requests.
-        The server runs indefinitely, handling one client request at a time.
+        The server runs indefinitely; each connection is served on its own thread
+        so a client holding a persistent connection doesn't block the others.
+        If given, `ready` is set once the socket is listening.
         """
 
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             s.bind((self.host, self.port))
             s.listen()
+            if ready is not None:
+                ready.set()
             print(f"{self.__class__.__name__} is running on {self.host}:{self.port}")
             while True:
                 conn, addr = s.accept()
-                with conn:
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        """Answer commands on one connection until the client closes it.
+
+        The protocol is newline-framed: every command ends with ``\\n``, so several can
+        share a connection and a command split across TCP segments is reassembled. Bytes
+        without a newline are only taken as a complete (legacy, unframed) command once the
+        client has gone quiet for LEGACY_IDLE_S. A pending command longer than
+        MAX_COMMAND_BYTES gets an error reply and the connection is closed.
+        """
+
+        with conn:
+            buf = b""
+            idle_timeout = None
+            while True:
+                # Wait indefinitely between commands, but only briefly for the rest of a line.
+                wanted = self.LEGACY_IDLE_S if buf else None
+                if wanted != idle_timeout:
+                    conn.settimeout(wanted)
+                    idle_timeout = wanted
+                try:
                     data = conn.recv(1024)
-                    if not data:
-                        continue
-
-                    if data in self.allowed_commands():
-                        current = self.measure_current()
-                        conn.sendall(str(current).encode("utf-8"))
-                    else:
-                        # Previously the infra returned nothing; that caused clients to hang / get empty reads.
-                        conn.sendall(b"ERROR: Unsupported command")
+                except socket.timeout:
+                    data = None  # client is waiting on an unframed command
+                except OSError:
+                    return
+
+                if data is None:
+                    commands, buf = [buf], b""
+                elif not data:
+                    return
+                else:
+                    buf += data
+                    *commands, buf = buf.split(b"\n")
+                    if len(buf) > self.MAX_COMMAND_BYTES:
+                        conn.sendall(b"ERROR: Command too long\n")
+                        return
+
+                for command in commands:
+                    command = command.rstrip(b"\r")
+                    if command:
+                        conn.sendall(self._respond(command) + b"\n")
+
+    def _respond(self, command: bytes) -> bytes:
+        if command in self._allowed_commands:
+            current = self.measure_current()
+            return str(current).encode("utf-8")
+        # Previously the infra returned nothing; that caused clients to hang / get empty reads.
+        return b"ERROR: Unsupported command"
 
     @property
     @abstractmethod
@@ -1,4 +1,25 @@
+import asyncio
 from socket import socket, AF_INET, SOCK_STREAM
+from typing import Iterable, List, Tuple
+
+
+def _framed(command: bytes) -> bytes:
+    # Emulators read newline-terminated commands; a bare one is only served after an idle delay.
+    return command if command.endswith(b"\n") else command + b"\n"
+
+
+def _handle_response(port: int, data: bytes) -> str:
+    if not data:
+        msg = "No data received."
+        print(msg)
+        return msg
+
+    response = data.decode("utf-8", errors="replace").strip()
+    if response.startswith("ERROR:"):
+        print(f"Received error from port {port}: {response}")
+    else:
+        print(f"Received current measurement from port {port}: {response} A")
+    return response
 
 
 def request_current_from_ammeter(port: int, command: bytes, host: str = "localhost", timeout_s: float = 2.0):
@@ -10,17 +31,33 @@ def request_current_from_ammeter(port: int, command: bytes, host: str = "localho
     with socket(AF_INET, SOCK_STREAM) as s:
         s.settimeout(timeout_s)
         s.connect((host, port))
-        s.sendall(command)
+        s.sendall(_framed(command))
         data = s.recv(1024)
-        if not data:
-            msg = "No data received."
-            print(msg)
-            return msg
-
-        response = data.decode("utf-8", errors="replace")
-        if response.startswith("ERROR:"):
-            print(f"Received error from port {port}: {response}")
-        else:
-            print(f"Received current measurement from port {port}: {response} A")
-        return response
+    return _handle_response(port, data)
+
+
+async def _request_async(host: str, port: int, command: bytes, timeout_s: float) -> bytes:
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout_s)
+    try:
+        writer.write(_framed(command))
+        await writer.drain()
+        return await asyncio.wait_for(reader.read(1024), timeout_s)
+    finally:
+        writer.close()
+
+
+async def _gather_requests(items: List[Tuple[int, bytes]], host: str, timeout_s: float) -> List[bytes]:
+    return await asyncio.gather(*[_request_async(host, port, cmd, timeout_s) for port, cmd in items])
+
+
+def request_many(items: Iterable[Tuple[int, bytes]], host: str = "localhost", timeout_s: float = 2.0) -> List[str]:
+    """Request one measurement from several emulators concurrently.
+
+    ``items`` are (port, command) pairs. The requests overlap, so the total wait is roughly
+    the slowest emulator rather than the sum of all of them. Responses are returned in the
+    same order as ``items``.
+    """
 
+    items = list(items)
+    responses = asyncio.run(_gather_requests(items, host, timeout_s))
+    return [_handle_response(port, data) for (port, _), data in zip(items, responses)]
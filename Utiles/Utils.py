@@ -2,11 +2,24 @@
 Utility functions for configuration management and random data generation.
 """
 
+import copy
 import random
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
+
 import yaml
 
+try:  # libyaml C parser when PyYAML was built with it; same output as safe_load
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:  # optional: compiles the constant schema below into a specialised validator
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 
 CONFIG_PATH = "config/test_config.yaml"
 DEFAULTS = {
@@ -15,16 +28,83 @@ DEFAULTS = {
     "circutor": {"port": 5002, "command": b"MEASURE_CIRCUTOR -get_measurement"},
 }
 
+# Same rules as the hand-written checks in _check_config_schema.
+CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["ammeters", "testing"],
+    "properties": {
+        "ammeters": {
+            "type": "object",
+            "additionalProperties": {"type": "object", "required": ["port", "command"]},
+        },
+        "testing": {
+            "type": "object",
+            "required": ["sampling"],
+            "properties": {
+                "sampling": {
+                    "type": "object",
+                    "required": ["sampling_frequency_hz"],
+                    "anyOf": [
+                        {"required": ["measurements_count"]},
+                        {"required": ["total_duration_seconds"]},
+                    ],
+                },
+            },
+        },
+    },
+}
+_COMPILED_SCHEMA = fastjsonschema.compile(CONFIG_SCHEMA) if fastjsonschema else None
+
+_YAML_CACHE_MAX_ENTRIES = 32
+# str(path) -> (st_mtime_ns, st_size, parsed document), least recently used first.
+_YAML_CACHE: "OrderedDict[str, Tuple[int, int, Any]]" = OrderedDict()
+
+
+def parse_yaml_file(path: Path) -> Any:
+    """Parse a YAML file, reusing the previous result while the file is unchanged.
+
+    Entries are validated by (mtime in integer ns, size) from a single stat(). Callers always get a deep copy, so mutating
+    the returned document can't corrupt the cache. A missing file raises FileNotFoundError from that same stat(), so
+    callers don't need a separate exists() check. framework.config_loader reuses this helper.
+    """
+
+    st = path.stat()
+    key = str(path)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    with path.open("r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX_ENTRIES:
+        _YAML_CACHE.popitem(last=False)
+    return data
+
+
 # Config helpers
 def load_yaml(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = parse_yaml_file(path)
     if not isinstance(data, dict):
         raise ValueError(f"Config must be a mapping/dict. Got: {type(data)}")
     return data
 
 
 def validate_config_schema(cfg: Dict[str, Any]) -> None:
+    if _COMPILED_SCHEMA is None:
+        _check_config_schema(cfg)
+        return
+    try:
+        _COMPILED_SCHEMA(cfg)
+    except fastjsonschema.JsonSchemaException as e:
+        # Re-run the plain checks so callers get the same error messages either way.
+        _check_config_schema(cfg)
+        raise ValueError(f"Invalid config: {e.message}") from e
+
+
+def _check_config_schema(cfg: Dict[str, Any]) -> None:
     # Minimal validation aligned with your README schema
     if "ammeters" not in cfg or not isinstance(cfg["ammeters"], dict):
         raise ValueError("Config must contain 'ammeters:' mapping")
@@ -63,9 +143,12 @@ def override_results_path(cfg: Dict[str, Any], results_dir: Path) -> Dict[str, A
     return cfg
 
 
-def generate_random_float(min_value: float, max_value: float) -> float:
-    """Generate a random float between min_value and max_value."""
-    return random.uniform(min_value, max_value)
+def generate_random_float(min_value: float, max_value: float, rng: Optional[random.Random] = None) -> float:
+    """Generate a random float between min_value and max_value.
+
+    Uses `rng` when given (e.g. an emulator's own generator), else the module-level one.
+    """
+    return (rng or random).uniform(min_value, max_value)
 
 
 def get_config_path() -> Path:
@@ -73,17 +156,23 @@ def get_config_path() -> Path:
 
 
 def load_config(path: Path) -> Dict:
-    if not path.exists():
+    try:
+        return parse_yaml_file(path) or {}
+    except FileNotFoundError:
         return {}
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
     
 
 def resolve_ports_and_commands(cfg: Dict) -> Dict[str, Tuple[int, bytes]]:
     result: Dict[str, Tuple[int, bytes]] = {}
     ammeters_cfg = (cfg or {}).get("ammeters", {})
     for key in ("greenlee", "entes", "circutor"):
-        port = int(ammeters_cfg.get(key, {}).get("port", DEFAULTS[key]["port"]))
-        cmd = ammeters_cfg.get(key, {}).get("command", DEFAULTS[key]["command"].decode("utf-8"))
-        result[key] = (port, cmd.encode("utf-8"))
+        entry = ammeters_cfg.get(key) or {}
+        port = int(entry.get("port", DEFAULTS[key]["port"]))
+        cmd = entry.get("command")
+        # DEFAULTS already hold bytes; only config strings need encoding.
+        if cmd is None:
+            cmd = DEFAULTS[key]["command"]
+        elif not isinstance(cmd, bytes):
+            cmd = cmd.encode("utf-8")
+        result[key] = (port, cmd)
     return result
\ No newline at end of file
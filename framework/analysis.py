@@ -1,15 +1,32 @@
 from __future__ import annotations
 
 import math
-import statistics
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
 
 from .unified_api import Measurement
 
 
+class _FrozenSlots:
+    """Pickle/copy support for frozen dataclasses with a hand-written __slots__.
+
+    The default slot-state restore assigns attributes, which frozen=True forbids, so
+    rebuild through __init__ instead. dataclass(slots=True) handles this itself, but
+    needs Python 3.10+.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+
 @dataclass(frozen=True)
-class Stats:
+class Stats(_FrozenSlots):
+    __slots__ = ("count", "ok_count", "mean", "median", "std_dev", "min", "max")
+
     count: int
     ok_count: int
     mean: Optional[float]
@@ -19,24 +36,115 @@ class Stats:
     max: Optional[float]
 
 
-def compute_stats(values: List[float]) -> Stats:
-    if not values:
-        return Stats(count=0, ok_count=0, mean=None, median=None, std_dev=None, min=None, max=None)
+def compute_stats(values: Union[Sequence[float], np.ndarray], count: Optional[int] = None) -> Stats:
+    """Stats over the ok values. `count` is the total number of measurements
+    (ok or not) and defaults to the number of values."""
+
+    arr = np.asarray(values, dtype=np.float64)
+    n = int(arr.size)
+    total = n if count is None else count
+    if n == 0:
+        return Stats(count=total, ok_count=0, mean=None, median=None, std_dev=None, min=None, max=None)
 
-    mean_v = statistics.fmean(values)
-    median_v = statistics.median(values)
-    std_v = statistics.pstdev(values) if len(values) >= 2 else 0.0
+    # Vectorized reductions; np.std defaults to the population std dev (ddof=0).
     return Stats(
-        count=len(values),
-        ok_count=len(values),
-        mean=mean_v,
-        median=median_v,
-        std_dev=std_v,
-        min=min(values),
-        max=max(values),
+        count=total,
+        ok_count=n,
+        mean=float(arr.mean()),
+        median=float(np.median(arr)),
+        std_dev=float(arr.std()) if n >= 2 else 0.0,
+        min=float(arr.min()),
+        max=float(arr.max()),
     )
 
 
+class RunningStats:
+    """Online (Welford) count/mean/variance/min/max, updated one measurement at a time.
+
+    add(None) counts a measurement without a value (failed or dropped).
+    """
+
+    __slots__ = ("count", "n", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: Optional[float]) -> None:
+        self.count += 1
+        if x is None:
+            return
+        self.n += 1
+        d = x - self.mean
+        self.mean += d / self.n
+        self.m2 += d * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def to_stats(self, median: Optional[float] = None) -> Stats:
+        """Snapshot as Stats; the median can't be tracked online, so the caller supplies it."""
+
+        if self.n == 0:
+            return Stats(count=self.count, ok_count=0, mean=None, median=None, std_dev=None, min=None, max=None)
+        return Stats(
+            count=self.count,
+            ok_count=self.n,
+            mean=self.mean,
+            median=median,
+            std_dev=math.sqrt(self.m2 / self.n) if self.n >= 2 else 0.0,  # population std dev
+            min=self.min,
+            max=self.max,
+        )
+
+
+@dataclass(frozen=True)
+class MeasurementColumns:
+    """Struct-of-arrays view of a measurement list, used internally by the analysis.
+
+    Built once at the analysis boundary so per-ammeter filtering becomes boolean masks
+    over contiguous arrays instead of attribute lookups on every Measurement.
+    """
+
+    names: List[str]  # ammeter names, in first-seen order
+    ammeter_idx: np.ndarray  # int32, index into names
+    value_a: np.ndarray  # float64, NaN where no value
+    ok: np.ndarray  # bool
+
+    @classmethod
+    def from_measurements(cls, measurements: List[Measurement]) -> "MeasurementColumns":
+        index: Dict[str, int] = {}
+        idx = [index.setdefault(m.ammeter, len(index)) for m in measurements]
+        values = [math.nan if m.value_a is None else m.value_a for m in measurements]
+        ok = [m.ok for m in measurements]
+        return cls(
+            names=list(index),
+            ammeter_idx=np.array(idx, dtype=np.int32),
+            value_a=np.array(values, dtype=np.float64),
+            ok=np.array(ok, dtype=np.bool_),
+        )
+
+    def totals(self) -> np.ndarray:
+        """Number of measurements per ammeter (ok or not), aligned with names."""
+
+        return np.bincount(self.ammeter_idx, minlength=len(self.names))
+
+    def ok_values(self) -> Dict[str, np.ndarray]:
+        """Valid readings (ok and with a value) per ammeter, in sampling order."""
+
+        valid = self.ok & ~np.isnan(self.value_a)
+        return {name: self.value_a[valid & (self.ammeter_idx == k)] for k, name in enumerate(self.names)}
+
+
+# ammeter name -> (total measurement count, ok values in sampling order)
+GroupedValues = Dict[str, Tuple[int, np.ndarray]]
+
+
 def split_by_ammeter(measurements: List[Measurement]) -> Dict[str, List[Measurement]]:
     out: Dict[str, List[Measurement]] = {}
     for m in measurements:
@@ -44,72 +152,76 @@ def split_by_ammeter(measurements: List[Measurement]) -> Dict[str, List[Measurem
     return out
 
 
-def stats_by_ammeter(measurements: List[Measurement]) -> Dict[str, Stats]:
-    by = split_by_ammeter(measurements)
-    ret: Dict[str, Stats] = {}
-    for name, ms in by.items():
-        vals = [m.value_a for m in ms if m.ok and m.value_a is not None]
-        s = compute_stats(vals)
-        # Count total + ok
-        ret[name] = Stats(
-            count=len(ms),
-            ok_count=len(vals),
-            mean=s.mean,
-            median=s.median,
-            std_dev=s.std_dev,
-            min=s.min,
-            max=s.max,
-        )
-    return ret
+def group_values(measurements: Union[List[Measurement], MeasurementColumns]) -> GroupedValues:
+    """Group measurements once so stats and agreement can share the result."""
+
+    if isinstance(measurements, MeasurementColumns):
+        cols = measurements
+    else:
+        cols = MeasurementColumns.from_measurements(measurements)
+    totals = cols.totals()
+    return {name: (int(totals[k]), vals) for k, (name, vals) in enumerate(cols.ok_values().items())}
+
+
+def _as_groups(measurements: Union[List[Measurement], GroupedValues]) -> GroupedValues:
+    return measurements if isinstance(measurements, dict) else group_values(measurements)
+
+
+def stats_by_ammeter(measurements: Union[List[Measurement], GroupedValues]) -> Dict[str, Stats]:
+    """Per-ammeter stats, from raw measurements or the output of group_values()."""
+
+    return {name: compute_stats(vals, count=total) for name, (total, vals) in _as_groups(measurements).items()}
 
 
 @dataclass(frozen=True)
-class Agreement:
+class Agreement(_FrozenSlots):
+    __slots__ = ("mae", "rmse", "correlation", "paired_count")
+
     mae: Optional[float]
     rmse: Optional[float]
     correlation: Optional[float]
     paired_count: int
 
 
-def _pearson(x: List[float], y: List[float]) -> Optional[float]:
-    if len(x) < 2 or len(y) < 2:
+def _pearson(x: np.ndarray, y: np.ndarray) -> Optional[float]:
+    if x.size < 2 or y.size < 2:
         return None
-    mx = statistics.fmean(x)
-    my = statistics.fmean(y)
-    num = sum((a - mx) * (b - my) for a, b in zip(x, y))
-    denx = math.sqrt(sum((a - mx) ** 2 for a in x))
-    deny = math.sqrt(sum((b - my) ** 2 for b in y))
+    dx = x - x.mean()
+    dy = y - y.mean()
+    denx = math.sqrt(float(dx @ dx))
+    deny = math.sqrt(float(dy @ dy))
     if denx == 0 or deny == 0:
         return None
-    return num / (denx * deny)
+    return float(dx @ dy) / (denx * deny)
 
 
-def pairwise_agreement(measurements: List[Measurement]) -> Dict[Tuple[str, str], Agreement]:
+def pairwise_agreement(
+    measurements: Union[List[Measurement], GroupedValues],
+) -> Dict[Tuple[str, str], Agreement]:
     """Compute agreement between ammeters.
 
     We pair measurements by sample index: since the sampler collects values in a fixed order per tick,
-    we can align them by ordering.
+    we can align them by ordering. Accepts raw measurements or the output of group_values().
     """
 
-    by = split_by_ammeter(measurements)
-    names = sorted(by.keys())
+    # One array per ammeter, built once and reused for every pair it takes part in.
+    arrs = {name: vals for name, (_, vals) in _as_groups(measurements).items()}
+    names = sorted(arrs.keys())
     out: Dict[Tuple[str, str], Agreement] = {}
 
     for i in range(len(names)):
         for j in range(i + 1, len(names)):
             a = names[i]
             b = names[j]
-            xs = [m.value_a for m in by[a] if m.ok and m.value_a is not None]
-            ys = [m.value_a for m in by[b] if m.ok and m.value_a is not None]
-            n = min(len(xs), len(ys))
-            xs = xs[:n]
-            ys = ys[:n]
+            n = min(arrs[a].size, arrs[b].size)
             if n == 0:
                 out[(a, b)] = Agreement(mae=None, rmse=None, correlation=None, paired_count=0)
                 continue
-            diffs = [abs(x - y) for x, y in zip(xs, ys)]
-            mae = statistics.fmean(diffs)
-            rmse = math.sqrt(statistics.fmean([(x - y) ** 2 for x, y in zip(xs, ys)]))
+            xs = arrs[a][:n]
+            ys = arrs[b][:n]
+            d = xs - ys
+            mae = float(np.abs(d).mean())
+            rmse = math.sqrt(float(d @ d) / n)
             corr = _pearson(xs, ys)
             out[(a, b)] = Agreement(mae=mae, rmse=rmse, correlation=corr, paired_count=n)
     return out
@@ -125,17 +237,20 @@ def reliability_ranking(stats: Dict[str, Stats], agreements: Dict[Tuple[str, str
     """
 
     names = list(stats.keys())
-    scores: Dict[str, float] = {n: 0.0 for n in names}
-    for n, s in stats.items():
+    index = {n: i for i, n in enumerate(names)}
+    scores = np.zeros(len(names))
+    for i, s in enumerate(stats.values()):
         success = (s.ok_count / s.count) if s.count else 0.0
         stability = 1.0 / (1.0 + (s.std_dev or 0.0))
-        scores[n] += 2.0 * success + stability
+        scores[i] = 2.0 * success + stability
 
     # Agreement penalty
     for (a, b), ag in agreements.items():
         if ag.rmse is None:
             continue
-        scores[a] += 1.0 / (1.0 + ag.rmse)
-        scores[b] += 1.0 / (1.0 + ag.rmse)
+        inc = 1.0 / (1.0 + ag.rmse)
+        scores[index[a]] += inc
+        scores[index[b]] += inc
 
-    return sorted(names, key=lambda n: scores[n], reverse=True)
+    # Stable sort keeps ties in insertion order, like sorted(..., reverse=True) did.
+    return [names[i] for i in np.argsort(-scores, kind="stable")]
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import List, Optional
+
+from .sampler import Sampler
+from .unified_api import TRUNCATED_REPLY, AmmeterClient, Measurement
+
+try:  # optional: faster drop-in event loop
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+class AsyncAmmeterClient:
+    """asyncio counterpart of AmmeterClient, using its settings and engine API (request,
+    parse_reply(), failed()).
+
+    Keeps one (reader, writer) stream pair open across samples; it is dropped on any
+    error or EOF and reopened by the next measure().
+    """
+
+    def __init__(self, client: AmmeterClient):
+        self.client = client
+        self.name = client.name
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    async def measure(self) -> Measurement:
+        c = self.client
+        t0 = time.monotonic()
+        epoch = time.time()
+        try:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.wait_for(
+                    asyncio.open_connection(c.host, c.port), c.timeout_s
+                )
+            self._writer.write(c.request)
+            await asyncio.wait_for(self._writer.drain(), c.timeout_s)
+            data = await asyncio.wait_for(self._reader.readuntil(b"\n"), c.timeout_s)
+        except asyncio.IncompleteReadError as e:
+            self.close()
+            if e.partial:
+                return c.failed(t0, epoch, ConnectionError(TRUNCATED_REPLY))
+            data = b""  # EOF before any byte: parsed as "no_data", like the other engines
+        except Exception as e:  # noqa: BLE001
+            self.close()
+            return c.failed(t0, epoch, e)
+        return c.parse_reply(t0, epoch, data)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
+
+
+class AsyncSampler(Sampler):
+    """Sampler that polls every ammeter from one asyncio event loop (uvloop if installed).
+
+    Each tick gathers one measure() coroutine per client, so a tick costs the slowest
+    round-trip rather than the sum. The loop and the connections persist for the whole
+    run; scheduling, fault injection and metrics are inherited from Sampler.
+    """
+
+    def _open_poller(self) -> None:
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        self._async_clients = [AsyncAmmeterClient(c) for c in self.clients]
+
+    def _poll_tick(self) -> List[Measurement]:
+        return self._loop.run_until_complete(self._gather())
+
+    async def _gather(self) -> List[Measurement]:
+        return list(await asyncio.gather(*[c.measure() for c in self._async_clients]))
+
+    def _close_poller(self) -> None:
+        for c in self._async_clients:
+            c.close()
+        # Let the transports finish closing before the loop goes away.
+        self._loop.run_until_complete(asyncio.sleep(0))
+        self._loop.close()
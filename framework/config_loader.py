@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
+# The mtime/size-keyed YAML cache lives with the emulator utilities, which must not
+# depend on this package.
+from Utiles.Utils import parse_yaml_file
 
 
 def load_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    try:
+        data = parse_yaml_file(path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
+    return data or {}
 
 
 @dataclass(frozen=True)
@@ -27,25 +32,26 @@ class SamplingCfg:
     measurements_count: Optional[int]
     total_duration_seconds: Optional[float]
     sampling_frequency_hz: float
+    engine: str = "threads"
 
 
 @dataclass(frozen=True)
 class VisualizationCfg:
     enabled: bool
-    plot_types: List[str]
+    plot_types: Tuple[str, ...]
 
 
 @dataclass(frozen=True)
 class AnalysisCfg:
-    metrics: List[str]
+    metrics: Tuple[str, ...]
     visualization: VisualizationCfg
 
 
 @dataclass(frozen=True)
 class ResultMgmtCfg:
     save_path: Path
-    save_format: str  # 'json' or 'csv'
-    metadata_fields: List[str]
+    save_format: str  # 'json', 'csv', or streamed while sampling: 'jsonl' / 'binary'
+    metadata_fields: Tuple[str, ...]
 
 
 @dataclass(frozen=True)
@@ -70,7 +76,9 @@ class FaultInjectionCfg:
 
 @dataclass(frozen=True)
 class ProjectConfig:
-    ammeters: List[AmmeterCfg]
+    """Typed, fully immutable config (tuples, not lists), so parsed instances can be shared."""
+
+    ammeters: Tuple[AmmeterCfg, ...]
     sampling: SamplingCfg
     analysis: AnalysisCfg
     results: ResultMgmtCfg
@@ -79,12 +87,33 @@ class ProjectConfig:
 
 
 def parse_config(raw: Dict[str, Any]) -> ProjectConfig:
+    """Build the typed config, memoized on the canonical JSON form of `raw`.
+
+    Repeated calls with an equal mapping return the same (immutable) ProjectConfig,
+    whatever file, dict or key order it came from.
+    """
+
+    try:
+        key = json.dumps(raw, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        # Not JSON-representable (e.g. YAML dates or mixed key types): parse without caching.
+        return _parse_config(raw)
+    return _parse_config_cached(key)
+
+
+@lru_cache(maxsize=16)
+def _parse_config_cached(key: str) -> ProjectConfig:
+    return _parse_config(json.loads(key))
+
+
+def _parse_config(raw: Dict[str, Any]) -> ProjectConfig:
     # Sampling
     sampling_raw = (raw.get("testing") or {}).get("sampling") or {}
     sampling = SamplingCfg(
         measurements_count=sampling_raw.get("measurements_count"),
         total_duration_seconds=sampling_raw.get("total_duration_seconds"),
         sampling_frequency_hz=float(sampling_raw.get("sampling_frequency_hz", 1.0)),
+        engine=str(sampling_raw.get("engine") or "threads").lower(),
     )
 
     # Ammeters
@@ -107,10 +136,10 @@ def parse_config(raw: Dict[str, Any]) -> ProjectConfig:
     analysis_raw = raw.get("analysis") or {}
     viz_raw = (analysis_raw.get("visualization") or {})
     analysis = AnalysisCfg(
-        metrics=list(analysis_raw.get("statistical_metrics") or []),
+        metrics=tuple(analysis_raw.get("statistical_metrics") or ()),
         visualization=VisualizationCfg(
             enabled=bool(viz_raw.get("enabled", False)),
-            plot_types=list(viz_raw.get("plot_types") or []),
+            plot_types=tuple(viz_raw.get("plot_types") or ()),
         ),
     )
 
@@ -119,7 +148,7 @@ def parse_config(raw: Dict[str, Any]) -> ProjectConfig:
     results = ResultMgmtCfg(
         save_path=Path(rm_raw.get("save_path", "results/")),
         save_format=str(rm_raw.get("save_format", "json")).lower(),
-        metadata_fields=list(rm_raw.get("metadata_fields") or []),
+        metadata_fields=tuple(rm_raw.get("metadata_fields") or ()),
     )
 
     # Optional sections (not in the YAML by default, but required by your instructions)
@@ -144,7 +173,7 @@ def parse_config(raw: Dict[str, Any]) -> ProjectConfig:
     )
 
     return ProjectConfig(
-        ammeters=ammeters,
+        ammeters=tuple(ammeters),
         sampling=sampling,
         analysis=analysis,
         results=results,
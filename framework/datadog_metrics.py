@@ -7,11 +7,30 @@ from typing import Dict, Iterable, Optional
 
 from .config_loader import DatadogCfg
 
+# Stay under a typical MTU so datagrams aren't fragmented (or dropped) on the way to the agent.
+MAX_DATAGRAM_BYTES = 1432
+
+# Per-measurement metric names (see TaggedEmitter.record_measurement)
+CURRENT_A = "current_a"
+MEASURE_OK = "measure_ok"
+MEASURE_ERROR = "measure_error"
+LATENCY_MS = "latency_ms"
+
+
+def _encode_tags(tags: Optional[Dict[str, str]]) -> bytes:
+    if not tags:
+        return b""
+    # dogstatsd tags format: |#tag1:value,tag2:value
+    return b"|#" + ",".join([f"{k}:{v}" for k, v in tags.items()]).encode("utf-8")
+
 
 class DogStatsd:
     """Minimal DogStatsD client (UDP) with zero external dependencies.
 
     If the agent isn't running, packets are dropped and the framework continues.
+
+    Metrics are buffered and sent as newline-separated lines packed into as few
+    datagrams as possible; call flush() to send whatever is pending.
     """
 
     def __init__(self, cfg: DatadogCfg):
@@ -19,33 +38,102 @@ class DogStatsd:
         self.addr = (cfg.host, cfg.port)
         self.namespace = cfg.namespace.rstrip(".")
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # metric name -> encoded b"namespace.name:" (the set of names is small and fixed)
+        self._prefix_cache: Dict[str, bytes] = {}
+        self._buf = bytearray()
 
     def _fmt(self, name: str) -> str:
         return f"{self.namespace}.{name}" if self.namespace else name
 
-    def _send(self, msg: str) -> None:
+    def _prefix(self, name: str) -> bytes:
+        prefix = self._prefix_cache.get(name)
+        if prefix is None:
+            prefix = self._fmt(name).encode("utf-8") + b":"
+            self._prefix_cache[name] = prefix
+        return prefix
+
+    def _send(self, payload: bytes) -> None:
+        if self._buf and len(self._buf) + 1 + len(payload) > MAX_DATAGRAM_BYTES:
+            self.flush()
+        if self._buf:
+            self._buf += b"\n"
+        self._buf += payload
+
+    def flush(self) -> None:
+        """Send buffered metrics in a single datagram."""
+
+        if not self._buf:
+            return
         try:
-            self._sock.sendto(msg.encode("utf-8"), self.addr)
+            self._sock.sendto(self._buf, self.addr)
         except Exception:
             # Never fail tests due to monitoring.
-            return
+            pass
+        finally:
+            self._buf.clear()
+
+    def close(self) -> None:
+        """Flush pending metrics and release the UDP socket."""
+
+        self.flush()
+        self._sock.close()
 
     def gauge(self, name: str, value: float, tags: Optional[Dict[str, str]] = None) -> None:
-        self._send(self._metric(name, value, "g", tags))
+        self._send(self._metric(name, value, b"g", _encode_tags(tags)))
 
     def increment(self, name: str, value: int = 1, tags: Optional[Dict[str, str]] = None) -> None:
-        self._send(self._metric(name, value, "c", tags))
+        self._send(self._metric(name, value, b"c", _encode_tags(tags)))
 
     def timing(self, name: str, value_ms: float, tags: Optional[Dict[str, str]] = None) -> None:
-        self._send(self._metric(name, value_ms, "ms", tags))
-
-    def _metric(self, name: str, value, mtype: str, tags: Optional[Dict[str, str]]) -> str:
-        metric = f"{self._fmt(name)}:{value}|{mtype}"
-        if tags:
-            # dogstatsd tags format: |#tag1:value,tag2:value
-            t = ",".join([f"{k}:{v}" for k, v in tags.items()])
-            metric += f"|#{t}"
-        return metric
+        self._send(self._metric(name, value_ms, b"ms", _encode_tags(tags)))
+
+    def for_tags(self, tags: Dict[str, str]) -> "TaggedEmitter":
+        """Emitter for a tag set that stays constant (e.g. one per ammeter)."""
+
+        return TaggedEmitter(self, tags)
+
+    def _metric(self, name: str, value, mtype: bytes, tag_suffix: bytes) -> bytes:
+        return b"".join((self._prefix(name), str(value).encode("ascii"), b"|", mtype, tag_suffix))
+
+
+class TaggedEmitter:
+    """Sends metrics through a DogStatsd client with fixed tags.
+
+    The tag suffix is encoded once at construction instead of on every metric, along
+    with the pieces of the per-measurement lines (the counter lines are fully constant).
+    """
+
+    def __init__(self, client: DogStatsd, tags: Dict[str, str]):
+        self._client = client
+        self._tag_suffix = tags_b = _encode_tags(tags)
+        self._current_prefix = client._prefix(CURRENT_A)
+        self._gauge_tail = b"|g" + tags_b + b"\n"
+        self._ok_line = client._prefix(MEASURE_OK) + b"1|c" + tags_b + b"\n"
+        self._error_line = client._prefix(MEASURE_ERROR) + b"1|c" + tags_b + b"\n"
+        self._latency_prefix = client._prefix(LATENCY_MS)
+        self._timing_tail = b"|ms" + tags_b
+
+    def gauge(self, name: str, value: float) -> None:
+        self._client._send(self._client._metric(name, value, b"g", self._tag_suffix))
+
+    def increment(self, name: str, value: int = 1) -> None:
+        self._client._send(self._client._metric(name, value, b"c", self._tag_suffix))
+
+    def timing(self, name: str, value_ms: float) -> None:
+        self._client._send(self._client._metric(name, value_ms, b"ms", self._tag_suffix))
+
+    def record_measurement(self, value_a: Optional[float], latency_ms: float) -> None:
+        """All metrics for one measurement in a single buffer append.
+
+        A value sends current_a + measure_ok, None sends measure_error; latency_ms always.
+        """
+
+        latency = (self._latency_prefix, str(latency_ms).encode("ascii"), self._timing_tail)
+        if value_a is not None:
+            head = (self._current_prefix, str(value_a).encode("ascii"), self._gauge_tail, self._ok_line)
+        else:
+            head = (self._error_line,)
+        self._client._send(b"".join(head + latency))
 
 
 def maybe_create_client(cfg: DatadogCfg) -> Optional[DogStatsd]:
@@ -2,21 +2,70 @@ from __future__ import annotations
 
 import csv
 import json
+import math
 import time
 import uuid
+from array import array
 from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Protocol, Sequence
+
+import numpy as np
 
 from .config_loader import ProjectConfig
 from .unified_api import Measurement
 
+try:  # optional: C JSON encoder, much faster than the stdlib on large runs
+    import orjson
+except ImportError:
+    orjson = None
+
+MEASUREMENT_FIELDS = (
+    "ammeter",
+    "timestamp_monotonic",
+    "wall_time_epoch",
+    "value_a",
+    "latency_s",
+    "ok",
+    "error",
+)
+
+# save_format -> name of the measurements file (a directory of column files for "binary")
+MEASUREMENT_FILES = {
+    "json": "measurements.json",
+    "csv": "measurements.csv",
+    "jsonl": "measurements.jsonl",
+    "binary": "measurements",
+}
+
 
 def new_run_id() -> str:
     ts = time.strftime("%Y%m%d_%H%M%S", time.localtime())
     return f"{ts}_{uuid.uuid4().hex[:8]}"
 
 
+def _json_compact(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_line(obj: Any) -> bytes:
+    return _json_compact(obj) + b"\n"
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _snapshot_default(obj: Any) -> Any:
+    # The typed config holds Path (save_path) and bytes (ammeter commands).
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, bytes):
+        return obj.decode("utf-8")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def measurement_to_dict(m: Measurement) -> Dict[str, Any]:
     return {
         "ammeter": m.ammeter,
@@ -29,6 +78,144 @@ def measurement_to_dict(m: Measurement) -> Dict[str, Any]:
     }
 
 
+class MeasurementSink(Protocol):
+    """Receives measurements in batches while sampling is still running."""
+
+    def write(self, batch: Sequence[Measurement]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonlSink:
+    """Appends measurements to a JSON Lines file, one object per line, one write per batch."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._f: BinaryIO = path.open("wb")
+
+    def write(self, batch: Sequence[Measurement]) -> None:
+        self._f.write(b"".join([_json_line(measurement_to_dict(m)) for m in batch]))
+
+    def close(self) -> None:
+        self._f.close()
+
+
+# Column file -> (array.array typecode, NumPy dtype); names match SampleStore's columns.
+_COLUMN_FILES = {
+    "ts.f64": ("d", np.float64),
+    "wall.f64": ("d", np.float64),
+    "val.f64": ("d", np.float64),  # NaN where there is no value
+    "lat.f64": ("d", np.float64),
+    "ok.u8": ("B", np.uint8),
+    "ammeter_code.i32": ("i", np.intc),
+}
+
+
+class ColumnarSink:
+    """Writes measurements as raw binary column files, appended once per batch.
+
+    One file per field (native byte order) in `path`, plus `codes.json` (ammeter code ->
+    name) and `errors.jsonl` (sparse row -> error text). Read back with load_run().
+    """
+
+    def __init__(self, path: Path):
+        path.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._files = {name: (path / name).open("wb") for name in _COLUMN_FILES}
+        self._errors = (path / "errors.jsonl").open("wb")
+        self._codes: Dict[str, int] = {}
+        self._rows = 0
+
+    def write(self, batch: Sequence[Measurement]) -> None:
+        cols = [array(typecode) for typecode, _ in _COLUMN_FILES.values()]
+        ts, wall, val, lat, ok, code = cols
+        codes = self._codes
+        errors = []
+        for i, m in enumerate(batch, start=self._rows):
+            ts.append(m.timestamp_monotonic)
+            wall.append(m.wall_time_epoch)
+            val.append(math.nan if m.value_a is None else m.value_a)
+            lat.append(m.latency_s)
+            ok.append(m.ok)
+            code.append(codes.setdefault(m.ammeter, len(codes)))
+            if m.error is not None:
+                errors.append(_json_line({"row": i, "error": m.error}))
+        self._rows += len(batch)
+        for col, f in zip(cols, self._files.values()):
+            col.tofile(f)
+        if errors:
+            self._errors.write(b"".join(errors))
+
+    def close(self) -> None:
+        for f in self._files.values():
+            f.close()
+        self._errors.close()
+        (self.path / "codes.json").write_text(json.dumps(list(self._codes)), encoding="utf-8")
+
+
+def load_run(path: Path) -> Dict[str, Any]:
+    """Load a ColumnarSink directory as NumPy arrays (no parsing).
+
+    Returns the columns under their SampleStore names (ts, wall, val, lat, ok,
+    ammeter_code) plus `codes` (list of names) and `errors` ({row: text}).
+    """
+
+    out: Dict[str, Any] = {}
+    for name, (_, dtype) in _COLUMN_FILES.items():
+        out[name.split(".")[0]] = np.fromfile(path / name, dtype=dtype)
+    out["ok"] = out["ok"].astype(np.bool_)
+    out["codes"] = json.loads((path / "codes.json").read_text(encoding="utf-8"))
+    errors: Dict[int, str] = {}
+    with (path / "errors.jsonl").open("rb") as f:
+        for line in f:
+            rec = _json_loads(line)
+            errors[rec["row"]] = rec["error"]
+    out["errors"] = errors
+    return out
+
+
+# How a successful record's "ok" field appears in compact JSON (orjson or the stdlib with
+# tight separators). Inside a string value the quotes would be escaped, so it can't match there.
+_OK_MARKER = b'"ok":true'
+
+
+def iter_measurement_records(path: Path, skip_ok: bool = False) -> Iterator[Optional[Dict[str, Any]]]:
+    """Yield measurement dicts from measurements.json/.jsonl without loading the whole file.
+
+    write_measurements() puts one record per line inside the JSON array, so records are
+    parsed line by line. Any other layout (e.g. pretty-printed by hand) falls back to
+    parsing the whole file at once. Both paths use orjson when it is installed.
+
+    With skip_ok=True, successful records are yielded as None so callers keep counts and
+    indices. Compact one-per-line records are recognised from the raw bytes and never
+    parsed; any other spelling (e.g. ``"ok": true``) is checked after parsing.
+    """
+
+    def parse(line: bytes) -> Optional[Dict[str, Any]]:
+        if skip_ok and _OK_MARKER in line:
+            return None  # fast path: no parse needed
+        record = _json_loads(line)
+        return None if skip_ok and record.get("ok") else record
+
+    with path.open("rb") as f:
+        if path.suffix == ".jsonl":
+            for line in f:
+                if line.strip():
+                    yield parse(line)
+            return
+
+        if f.readline().strip() == b"[":
+            line = f.readline().strip()
+            if line == b"]" or (line.startswith(b"{") and line.rstrip(b",").endswith(b"}")):
+                while line and line != b"]":
+                    yield parse(line.rstrip(b","))
+                    line = f.readline().strip()
+                return
+        f.seek(0)
+        for record in _json_loads(f.read()):
+            yield None if skip_ok and record.get("ok") else record
+
+
 class ResultStore:
     def __init__(self, cfg: ProjectConfig):
         self.cfg = cfg
@@ -40,22 +227,58 @@ class ResultStore:
         run_dir.mkdir(parents=True, exist_ok=True)
         return run_dir
 
-    def write_config_snapshot(self, run_dir: Path, raw_yaml: Dict[str, Any]) -> None:
-        (run_dir / "config.json").write_text(json.dumps(raw_yaml, indent=2), encoding="utf-8")
+    def write_config_snapshot(self, run_dir: Path, raw_yaml: Optional[Dict[str, Any]] = None) -> None:
+        """Write the config as given (raw YAML mapping), or the typed config if none was kept."""
+
+        snapshot = raw_yaml if raw_yaml is not None else asdict(self.cfg)
+        (run_dir / "config.json").write_text(json.dumps(snapshot, indent=2, default=_snapshot_default), encoding="utf-8")
+
+    def measurements_path(self, run_dir: Path) -> Path:
+        """Where the run's measurements are saved for the configured format (JSON by default)."""
+
+        return run_dir / MEASUREMENT_FILES.get(self.cfg.results.save_format, MEASUREMENT_FILES["json"])
+
+    def open_measurement_sink(self, run_dir: Path) -> Optional[MeasurementSink]:
+        """Sink that streams measurements to disk during sampling, for formats that support it."""
+
+        fmt = self.cfg.results.save_format
+        if fmt == "jsonl":
+            return JsonlSink(self.measurements_path(run_dir))
+        if fmt == "binary":
+            return ColumnarSink(self.measurements_path(run_dir))
+        return None
+
+    def write_measurements(self, run_dir: Path, measurements: Iterable[Measurement]) -> None:
+        """Write the run in the configured format, streaming `measurements` once."""
 
-    def write_measurements(self, run_dir: Path, measurements: List[Measurement]) -> None:
         fmt = self.cfg.results.save_format
-        rows = [measurement_to_dict(m) for m in measurements]
+        if fmt in ("jsonl", "binary"):
+            return  # already streamed by the sink from open_measurement_sink()
         if fmt == "csv":
-            out = run_dir / "measurements.csv"
+            # Stream plain tuples: no per-row dict, no DictWriter key lookups.
+            out = self.measurements_path(run_dir)
             with out.open("w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else [])
-                if rows:
-                    writer.writeheader()
-                    writer.writerows(rows)
+                writer = csv.writer(f)
+                writer.writerow(MEASUREMENT_FIELDS)
+                writer.writerows(
+                    (m.ammeter, m.timestamp_monotonic, m.wall_time_epoch, m.value_a, m.latency_s, m.ok, m.error)
+                    for m in measurements
+                )
         else:
-            out = run_dir / "measurements.json"
-            out.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+            # Still one JSON array, but one compact record per line so readers can stream it
+            # (see iter_measurement_records).
+            out = self.measurements_path(run_dir)
+            with out.open("wb") as f:
+                sep = b"[\n"
+                for m in measurements:
+                    f.write(sep + _json_compact(measurement_to_dict(m)))
+                    sep = b",\n"
+                f.write(b"[]\n" if sep == b"[\n" else b"\n]\n")
+
+    def write_errors_summary(self, run_dir: Path, errors_summary: Dict[str, Any]) -> None:
+        """Precomputed failure report, so readers needn't scan the measurements for it."""
+
+        (run_dir / "errors_summary.json").write_text(json.dumps(errors_summary, indent=2), encoding="utf-8")
 
     def write_summary(self, run_dir: Path, summary: Dict[str, Any]) -> None:
         (run_dir / "summary.json").write_text(json.dumps(summary, indent=2), encoding="utf-8")
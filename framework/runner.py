@@ -1,30 +1,61 @@
 from __future__ import annotations
 
 import time
+from dataclasses import asdict
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Optional
 
-from .analysis import pairwise_agreement, reliability_ranking, stats_by_ammeter
+from .analysis import group_values, pairwise_agreement, reliability_ranking
 from .config_loader import ProjectConfig
+from .async_sampler import AsyncSampler
 from .datadog_metrics import maybe_create_client
 from .faults import FaultInjector
 from .result_store import ResultStore
 from .sampler import Sampler
-from .unified_api import AmmeterClient, Measurement
+from .selector_sampler import SelectorSampler
+from .unified_api import AmmeterClient
 from .visualization import render_plots
 
+# testing.sampling.engine -> sampler implementation
+SAMPLERS = {"threads": Sampler, "selector": SelectorSampler, "asyncio": AsyncSampler}
+
+
+def run_project(cfg: ProjectConfig, raw_yaml: Optional[Dict[str, Any]] = None) -> Path:
+    """Sample, analyse and store one run; returns the run directory.
+
+    Only the typed config drives the run. `raw_yaml` is used just for the config.json
+    snapshot; without it the snapshot is written from `cfg`.
+    """
 
-def run_project(cfg: ProjectConfig, raw_yaml: Dict[str, Any]) -> Path:
     clients = [AmmeterClient(a.name, a.host, a.port, a.command) for a in cfg.ammeters]
     dd = maybe_create_client(cfg.datadog)
     faults = FaultInjector(cfg.fault_injection)
 
-    sampler = Sampler(clients=clients, sampling=cfg.sampling, fault_injector=faults, dd=dd)
-    measurements: List[Measurement] = sampler.run()
+    try:
+        sampler_cls = SAMPLERS[cfg.sampling.engine]
+    except KeyError:
+        raise ValueError(
+            f"Unknown sampling engine {cfg.sampling.engine!r} (expected one of {sorted(SAMPLERS)})"
+        ) from None
 
-    # Analysis
-    stats = stats_by_ammeter(measurements)
-    agreements = pairwise_agreement(measurements)
+    # The run directory exists up front so formats that stream can write while sampling.
+    store = ResultStore(cfg)
+    run_dir = store.create_run_dir()
+    sink = store.open_measurement_sink(run_dir)
+
+    sampler = sampler_cls(clients=clients, sampling=cfg.sampling, fault_injector=faults, dd=dd, sink=sink)
+    try:
+        samples = sampler.run()
+    finally:
+        if sink is not None:
+            sink.close()
+        if dd:
+            dd.close()
+
+    # Analysis: stats were accumulated while sampling; agreement pairs the stored columns
+    stats = sampler.stats()
+    groups = group_values(samples.columns())
+    agreements = pairwise_agreement(groups)
     ranking = reliability_ranking(stats, agreements)
 
     summary = {
@@ -34,18 +65,17 @@ def run_project(cfg: ProjectConfig, raw_yaml: Dict[str, Any]) -> Path:
             "total_duration_seconds": cfg.sampling.total_duration_seconds,
             "sampling_frequency_hz": cfg.sampling.sampling_frequency_hz,
         },
-        "stats_by_ammeter": {k: s.__dict__ for k, s in stats.items()},
+        "stats_by_ammeter": {k: asdict(s) for k, s in stats.items()},
         "pairwise_agreement": {
-            f"{a}__{b}": ag.__dict__ for (a, b), ag in agreements.items()
+            f"{a}__{b}": asdict(ag) for (a, b), ag in agreements.items()
         },
         "reliability_ranking": ranking,
     }
 
     # Results
-    store = ResultStore(cfg)
-    run_dir = store.create_run_dir()
     store.write_config_snapshot(run_dir, raw_yaml)
-    store.write_measurements(run_dir, measurements)
+    store.write_measurements(run_dir, samples.iter_measurements())
+    store.write_errors_summary(run_dir, samples.error_summary())
     store.write_summary(run_dir, summary)
     # A small set of metadata fields are expected by config/test_config.yaml
     store.write_metadata(
@@ -60,6 +90,8 @@ def run_project(cfg: ProjectConfig, raw_yaml: Dict[str, Any]) -> Path:
 
     # Plots (bonus)
     if cfg.analysis.visualization.enabled:
-        render_plots(measurements, cfg.analysis.visualization.plot_types, run_dir / "plots")
+        # Reuse the per-ammeter ok values grouped for the analysis above
+        series = {name: vals for name, (_, vals) in groups.items()}
+        render_plots(series, cfg.analysis.visualization.plot_types, run_dir / "plots")
 
     return run_dir
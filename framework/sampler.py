@@ -1,24 +1,158 @@
 from __future__ import annotations
 
+import math
 import time
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
+import numpy as np
+
+from .analysis import MeasurementColumns, RunningStats, Stats
 from .config_loader import SamplingCfg
 from .datadog_metrics import DogStatsd
 from .faults import FaultInjector
+from .result_store import MeasurementSink
 from .unified_api import AmmeterClient, Measurement
 
 
-@dataclass(frozen=True)
-class SampleBatch:
-    measurements: List[Measurement]
+class SampleStore:
+    """Columnar (struct-of-arrays) storage for the measurements of one run.
+
+    Each field lives in a preallocated NumPy array (grown by doubling if the estimate
+    was short); ammeter names are stored as integer codes into `codes`, missing values
+    as NaN. Error strings are rare, so they are kept sparsely by row index.
+    """
+
+    _COLUMNS = ("ts", "wall", "val", "lat", "ok", "ammeter_code")
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(1, int(capacity))
+        self.ts = np.empty(capacity, dtype=np.float64)
+        self.wall = np.empty(capacity, dtype=np.float64)
+        self.val = np.empty(capacity, dtype=np.float64)
+        self.lat = np.empty(capacity, dtype=np.float64)
+        self.ok = np.empty(capacity, dtype=np.bool_)
+        self.ammeter_code = np.empty(capacity, dtype=np.int32)
+        self.codes: List[str] = []
+        self.errors: Dict[int, str] = {}
+        self.size = 0
+        self._code_of: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self.ts)
+        for name in self._COLUMNS:
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+
+    def append(self, m: Measurement) -> None:
+        i = self.size
+        if i == len(self.ts):
+            self._grow()
+        code = self._code_of.get(m.ammeter)
+        if code is None:
+            code = self._code_of[m.ammeter] = len(self.codes)
+            self.codes.append(m.ammeter)
+        self.ts[i] = m.timestamp_monotonic
+        self.wall[i] = m.wall_time_epoch
+        self.val[i] = math.nan if m.value_a is None else m.value_a
+        self.lat[i] = m.latency_s
+        self.ok[i] = m.ok
+        self.ammeter_code[i] = code
+        if m.error is not None:
+            self.errors[i] = m.error
+        self.size = i + 1
+
+    def columns(self) -> MeasurementColumns:
+        """The analysis view of the stored rows (no per-Measurement pass needed)."""
+
+        n = self.size
+        return MeasurementColumns(
+            names=list(self.codes),
+            ammeter_idx=self.ammeter_code[:n],
+            value_a=self.val[:n],
+            ok=self.ok[:n],
+        )
+
+    def error_summary(self, max_failed: int = 20) -> Dict[str, Any]:
+        """Failure counts by error and by ammeter, plus the first `max_failed` failed rows.
+
+        Computed from the columns, so reporting errors doesn't need another pass over the
+        stored measurements. Row indices match the order of measurements.json.
+        """
+
+        n = self.size
+        failed = np.flatnonzero(~self.ok[:n])
+        errors = self.errors
+        by_type = Counter(errors.get(i) or "unknown" for i in failed.tolist())
+        per_code = np.bincount(self.ammeter_code[failed], minlength=len(self.codes))
+        return {
+            "total": n,
+            "failed": int(failed.size),
+            "by_type": dict(by_type),
+            "by_ammeter": {name: int(c) for name, c in zip(self.codes, per_code.tolist()) if c},
+            "first_failed": [
+                {
+                    "index": i,
+                    "ammeter": self.codes[self.ammeter_code[i]],
+                    "error": errors.get(i) or "unknown",
+                    "timestamp": float(self.wall[i]),
+                    "latency_s": float(self.lat[i]),
+                }
+                for i in failed[:max_failed].tolist()
+            ],
+        }
+
+    def iter_measurements(self, block_rows: int = 4096) -> Iterator[Measurement]:
+        """Yield the stored rows as Measurement tuples, converting one block at a time.
+
+        Writers stream from this, so a run is never held as a full list of objects.
+        """
+
+        codes = self.codes
+        errors = self.errors
+        for start in range(0, self.size, block_rows):
+            stop = min(start + block_rows, self.size)
+            rows = zip(
+                self.ammeter_code[start:stop].tolist(),
+                self.ts[start:stop].tolist(),
+                self.wall[start:stop].tolist(),
+                self.val[start:stop].tolist(),
+                self.lat[start:stop].tolist(),
+                self.ok[start:stop].tolist(),
+            )
+            for i, (code, ts, wall, val, lat, ok) in enumerate(rows, start=start):
+                yield Measurement(codes[code], ts, wall, None if math.isnan(val) else val, lat, ok, errors.get(i))
+
+    def to_measurements(self) -> List[Measurement]:
+        """Rebuild Measurement tuples for callers that work on lists."""
+
+        return list(self.iter_measurements())
+
+
+def _expected_rows(sampling: SamplingCfg, n_clients: int) -> int:
+    """Row estimate used to preallocate the SampleStore."""
+
+    ticks = []
+    if sampling.measurements_count is not None:
+        ticks.append(int(sampling.measurements_count))
+    if sampling.total_duration_seconds is not None:
+        ticks.append(int(math.ceil(float(sampling.total_duration_seconds) * sampling.sampling_frequency_hz)) + 1)
+    return (min(ticks) if ticks else 1024) * max(1, n_clients)
 
 
 class Sampler:
     """Real-time-ish sampler.
 
-    Uses time.monotonic() scheduling to reduce drift.
+    Schedules ticks on absolute time.monotonic_ns() deadlines, in integer nanoseconds, so
+    there is no drift or float rounding build-up over long runs. Within a tick all ammeters are
+    polled concurrently, so a tick takes about as long as the slowest ammeter rather
+    than the sum of all of them.
     """
 
     def __init__(
@@ -27,52 +161,138 @@ class Sampler:
         sampling: SamplingCfg,
         fault_injector: Optional[FaultInjector] = None,
         dd: Optional[DogStatsd] = None,
+        sink: Optional[MeasurementSink] = None,
+        sink_batch_size: int = 1024,
     ):
         if sampling.sampling_frequency_hz <= 0:
             raise ValueError("sampling_frequency_hz must be > 0")
         self.clients = clients
         self.sampling = sampling
         self.period_s = 1.0 / sampling.sampling_frequency_hz
+        self.period_ns = int(1e9 / sampling.sampling_frequency_hz)
         self.faults = fault_injector
         self.dd = dd
+        # Optional: measurements are handed to the sink in batches while sampling runs.
+        # The sampler does not close it; whoever opened it does.
+        self.sink = sink
+        self.sink_batch_size = max(1, int(sink_batch_size))
+        # One emitter per ammeter: its tag suffix is encoded once for the whole run.
+        self._dd_emitters = {c.name: dd.for_tags({"ammeter": c.name}) for c in clients} if dd else {}
+        self._capacity = _expected_rows(sampling, len(clients))
+        # Placeholder until run() allocates the full-size store for the run.
+        self.store = SampleStore(0)
+        self._running: Dict[str, RunningStats] = {}
+
+    def run(self) -> SampleStore:
+        """Sample until the configured count/duration is reached; returns the run's store.
 
-    def run(self) -> List[Measurement]:
-        out: List[Measurement] = []
-        t_start = time.monotonic()
+        The columnar store is the only in-memory copy of the run: analysis reads its
+        columns() and writers stream store.iter_measurements().
+        """
+
+        store = self.store = SampleStore(self._capacity)
+        self._running = {c.name: RunningStats() for c in self.clients}
+        # Stop conditions, resolved once; the duration is compared in integer nanoseconds.
+        max_ticks = None if self.sampling.measurements_count is None else int(self.sampling.measurements_count)
+        dur_ns = (
+            None
+            if self.sampling.total_duration_seconds is None
+            else int(float(self.sampling.total_duration_seconds) * 1e9)
+        )
+        # Everything the loop touches is bound to a local once.
+        period_ns = self.period_ns
+        mono = time.monotonic_ns
+        sleep = time.sleep
+        poll = self._poll_tick
+        append = store.append
+        # Welford stats per client, aligned with the readings, so stats() needs no extra pass.
+        running = [self._running[c.name].add for c in self.clients]
+        apply_fault = self.faults.apply if self.faults else None
+        # DataDog (optional): one record function per client, aligned with the readings.
+        record = [self._dd_emitters[c.name].record_measurement for c in self.clients] if self.dd else None
+        flush = self.dd.flush if self.dd else None
+        sink = self.sink
+        batch_size = self.sink_batch_size
+        batch: List[Measurement] = []
         n = 0
+        self._open_poller()
+        start_ns = mono()
 
-        while True:
-            # Stop conditions
-            if self.sampling.measurements_count is not None and n >= int(self.sampling.measurements_count):
-                break
-            if self.sampling.total_duration_seconds is not None:
-                if (time.monotonic() - t_start) >= float(self.sampling.total_duration_seconds):
+        try:
+            while max_ticks is None or n < max_ticks:
+                now_ns = mono()
+                if dur_ns is not None and now_ns - start_ns >= dur_ns:
                     break
 
-            target_t = t_start + n * self.period_s
-            now = time.monotonic()
-            sleep_s = target_t - now
-            if sleep_s > 0:
-                time.sleep(sleep_s)
+                # Absolute deadlines (start + n * period) so jitter does not accumulate.
+                delta_ns = start_ns + n * period_ns - now_ns
+                if delta_ns > 0:
+                    sleep(delta_ns * 1e-9)
+
+                # Collect one reading per ammeter per "tick"; post-processing stays on this
+                # thread and in client order, so results are deterministic.
+                for k, m in enumerate(poll()):
+                    if apply_fault is not None:
+                        m = apply_fault(m)
+
+                    append(m)
+                    value = m.value_a if m.ok else None
+                    running[k](value)
+                    if sink is not None:
+                        batch.append(m)
+
+                    if record is not None:
+                        record[k](value, m.latency_s * 1000.0)
 
-            # Collect one reading per ammeter per "tick"
-            for c in self.clients:
-                m = c.measure()
-                if self.faults:
-                    m = self.faults.apply(m)
+                # One datagram per tick instead of one per metric
+                if flush is not None:
+                    flush()
 
-                out.append(m)
+                if sink is not None and len(batch) >= batch_size:
+                    sink.write(batch)
+                    batch = []
 
-                # DataDog metrics (optional)
-                if self.dd:
-                    tags = {"ammeter": m.ammeter}
-                    if m.ok and m.value_a is not None:
-                        self.dd.gauge("current_a", m.value_a, tags=tags)
-                        self.dd.increment("measure_ok", tags=tags)
-                    else:
-                        self.dd.increment("measure_error", tags=tags)
-                    self.dd.timing("latency_ms", m.latency_s * 1000.0, tags=tags)
+                n += 1
 
-            n += 1
+            # Normal exit only: a sink failure while unwinding would replace the original error.
+            if batch:
+                sink.write(batch)
+        finally:
+            if self.dd:
+                self.dd.flush()  # anything left from an interrupted tick
+            self._close_poller()
+            self.close()
 
+        return store
+
+    # Per-tick polling; subclasses (e.g. SelectorSampler) swap the I/O strategy.
+    def _open_poller(self) -> None:
+        # Socket I/O releases the GIL, so one thread per ammeter overlaps the round-trips.
+        self._pool = ThreadPoolExecutor(max_workers=max(1, len(self.clients)), thread_name_prefix="amm")
+
+    def _poll_tick(self) -> List[Measurement]:
+        return list(self._pool.map(lambda c: c.measure(), self.clients))
+
+    def _close_poller(self) -> None:
+        self._pool.shutdown()
+
+    def stats(self) -> Dict[str, Stats]:
+        """Per-ammeter stats of the last run (mean/std/min/max were tracked while sampling).
+
+        Only the median needs the stored values.
+        """
+
+        values = self.store.columns().ok_values()
+        out: Dict[str, Stats] = {}
+        for name, rs in self._running.items():
+            if rs.count == 0:
+                continue
+            median = float(np.median(values[name])) if rs.n else None
+            out[name] = rs.to_stats(median=median)
         return out
+
+    def close(self) -> None:
+        """Close the clients' persistent connections."""
+
+        for c in self.clients:
+            c.close()
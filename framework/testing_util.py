@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import errno
+import functools
+import importlib
+import selectors
+import socket
+import threading
+import time
+from typing import Callable, Dict, Iterable, Mapping, Optional, Set, Tuple
+
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN}
+
+# Config ammeter name -> (module, class) of its emulator; imported only when first started.
+EMULATORS = {
+    "greenlee": ("Ammeters.Greenlee_Ammeter", "GreenleeAmmeter"),
+    "entes": ("Ammeters.Entes_Ammeter", "EntesAmmeter"),
+    "circutor": ("Ammeters.Circutor_Ammeter", "CircutorAmmeter"),
+}
+
+# (name, port) -> ready Event of every emulator started in this process; they serve until exit.
+_STARTED: Dict[Tuple[str, int], threading.Event] = {}
+
+
+def _probe(host: str, ports: Set[int], deadline: float) -> Set[int]:
+    """One concurrent connect attempt per port; returns the ports that did not accept."""
+
+    failed: Set[int] = set()
+    sel = selectors.DefaultSelector()
+    socks = []
+    try:
+        for port in ports:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            socks.append(s)
+            s.setblocking(False)
+            err = s.connect_ex((host, port))
+            if err in _IN_PROGRESS:
+                sel.register(s, selectors.EVENT_WRITE, port)
+            elif err != 0:
+                failed.add(port)
+
+        while sel.get_map():
+            events = sel.select(timeout=max(0.0, deadline - time.monotonic()))
+            if not events:
+                failed.update(key.data for key in sel.get_map().values())
+                break
+            for key, _ in events:
+                sel.unregister(key.fileobj)
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR):
+                    failed.add(key.data)
+    finally:
+        sel.close()
+        for s in socks:
+            s.close()
+    return failed
+
+
+def wait_for_ports(ports: Iterable[int], host: str = "127.0.0.1", timeout: float = 2.0) -> None:
+    """Block until every port accepts TCP connections (e.g. emulators started in threads).
+
+    All ports are probed at once with non-blocking connects; refused ones are retried
+    with exponential backoff (10 ms, doubling up to 50 ms), so a server is noticed at most
+    ~50 ms after it starts listening. Raises TimeoutError naming the ports that never
+    came up.
+    """
+
+    pending = {int(p) for p in ports}
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while pending:
+        pending = _probe(host, pending, deadline)
+        if not pending:
+            return
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"No server accepting connections on {host} port(s) {sorted(pending)}")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.05)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_emulator_starter(name: str) -> Callable[..., None]:
+    """Import the emulator class once and return ``(port, ready=None) -> start_server()``."""
+
+    try:
+        module_name, class_name = EMULATORS[name]
+    except KeyError:
+        raise ValueError(f"Unknown emulator {name!r} (expected one of {sorted(EMULATORS)})") from None
+    cls = getattr(importlib.import_module(module_name), class_name)
+
+    def start(port: int, ready: Optional[threading.Event] = None) -> None:
+        cls(port).start_server(ready=ready)
+
+    return start
+
+
+def start_emulators(ports: Mapping[str, int], timeout: float = 2.0) -> None:
+    """Start the named emulators on daemon threads and wait until they all listen.
+
+    Each emulator signals its own ready Event right after listen(), so this returns as
+    soon as the last one is up. An emulator that fails to bind raises TimeoutError here.
+    Emulators already started on the same port by an earlier call (e.g. another test
+    module in the same run) are reused rather than started again.
+    """
+
+    events = {}
+    for name, port in ports.items():
+        key = (name, int(port))
+        ready = _STARTED.get(key)
+        if ready is None:
+            _STARTED[key] = ready = threading.Event()
+            threading.Thread(
+                target=_resolve_emulator_starter(name), args=(key[1],), kwargs={"ready": ready}, daemon=True
+            ).start()
+        events[name] = ready
+
+    deadline = time.monotonic() + timeout
+    for name, ready in events.items():
+        if not ready.wait(max(0.0, deadline - time.monotonic())):
+            raise TimeoutError(f"Emulator {name!r} did not start listening on port {ports[name]}")
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
-from socket import socket, AF_INET, SOCK_STREAM
-from typing import Optional
+from socket import socket, AF_INET, IPPROTO_TCP, SOCK_STREAM, SOL_SOCKET, SO_KEEPALIVE, TCP_NODELAY
+from typing import NamedTuple, Optional
 
+# Bound once; measure() runs every tick for every ammeter.
+_monotonic = time.monotonic
+_wall_time = time.time
+
+# Replies are a short ASCII number (or "ERROR: ...") plus "\n"; longer ones are read in a loop.
+RECV_BYTES = 64
+# Error text for a connection that hit EOF in the middle of a reply line: "12" from a
+# cut-off "123.4\n" is not a reading.
+TRUNCATED_REPLY = "truncated reply"
+
+
+class Measurement(NamedTuple):
+    """One reading. Immutable; use ``m._replace(...)`` to derive a modified copy."""
 
-@dataclass(frozen=True)
-class Measurement:
     ammeter: str
     timestamp_monotonic: float
     wall_time_epoch: float
@@ -18,7 +28,19 @@ class Measurement:
 
 
 class AmmeterClient:
-    """Unifies communication with the different emulator types."""
+    """Unifies communication with the different emulator types.
+
+    One TCP connection is kept open across samples. It is opened lazily and dropped
+    on any error, so the next measure() call reconnects. Call close() when done sampling.
+
+    Wire format: the client sends ``<command>\n`` and the emulator answers
+    ``<float>\n`` (ASCII, e.g. ``b"1.2345\n"``) or ``ERROR: <reason>\n``.
+
+    Sampling engines that do their own I/O (SelectorSampler, AsyncSampler) use the
+    engine API below instead of measure(): ``request`` (the bytes to send),
+    connection(), parse_reply() and failed(). Both result methods keep the
+    connection state consistent, dropping it whenever the exchange went wrong.
+    """
 
     def __init__(self, name: str, host: str, port: int, command: bytes, timeout_s: float = 2.0):
         self.name = name
@@ -26,56 +48,119 @@ class AmmeterClient:
         self.port = int(port)
         self.command = command
         self.timeout_s = float(timeout_s)
+        self.request = command + b"\n"
+        self._sock: Optional[socket] = None
+        # Reused receive buffer, so a reply costs one bytes object rather than one per recv().
+        self._rxview = memoryview(bytearray(RECV_BYTES))
 
-    def measure(self) -> Measurement:
-        t0 = time.monotonic()
-        epoch = time.time()
+    def _connect(self) -> socket:
+        s = socket(AF_INET, SOCK_STREAM)
         try:
-            with socket(AF_INET, SOCK_STREAM) as s:
-                s.settimeout(self.timeout_s)
-                s.connect((self.host, self.port))
-                s.sendall(self.command)
-                data = s.recv(1024)
+            s.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+            s.setsockopt(SOL_SOCKET, SO_KEEPALIVE, 1)
+            s.settimeout(self.timeout_s)
+            s.connect((self.host, self.port))
+        except Exception:
+            s.close()
+            raise
+        self._sock = s
+        return s
 
-            if not data:
-                return Measurement(
-                    ammeter=self.name,
-                    timestamp_monotonic=t0,
-                    wall_time_epoch=epoch,
-                    value_a=None,
-                    latency_s=time.monotonic() - t0,
-                    ok=False,
-                    error="no_data",
-                )
+    def connection(self) -> socket:
+        """The persistent socket, connected first if needed (engine API)."""
 
-            resp = data.decode("utf-8", errors="replace").strip()
-            if resp.startswith("ERROR:"):
-                return Measurement(
-                    ammeter=self.name,
-                    timestamp_monotonic=t0,
-                    wall_time_epoch=epoch,
-                    value_a=None,
-                    latency_s=time.monotonic() - t0,
-                    ok=False,
-                    error=resp,
-                )
+        return self._sock or self._connect()
 
-            value = float(resp)
-            return Measurement(
-                ammeter=self.name,
-                timestamp_monotonic=t0,
-                wall_time_epoch=epoch,
-                value_a=value,
-                latency_s=time.monotonic() - t0,
-                ok=True,
-            )
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def close(self) -> None:
+        """Close the persistent connection (a later measure() reopens it)."""
+
+        self._disconnect()
+
+    def _exchange(self) -> bytes:
+        s = self.connection()
+        s.sendall(self.request)
+        view = self._rxview
+        n = s.recv_into(view)
+        if n and view[n - 1] == 0x0A:  # whole line in one read (the usual case)
+            return view[:n].tobytes()
+        # Short read (TCP may split the reply) or a reply longer than the buffer:
+        # keep reading until the newline or EOF.
+        data = bytearray(view[:n])
+        while n and not data.endswith(b"\n"):
+            n = s.recv_into(view)
+            data += view[:n]
+        if data and not n:
+            raise ConnectionError(TRUNCATED_REPLY)
+        return bytes(data)
+
+    def measure(self) -> Measurement:
+        t0 = _monotonic()
+        epoch = _wall_time()
+        try:
+            data = self._exchange()
         except Exception as e:  # noqa: BLE001
+            return self.failed(t0, epoch, e)
+        return self.parse_reply(t0, epoch, data)
+
+    def parse_reply(self, t0: float, epoch: float, data: bytes) -> Measurement:
+        """Build the Measurement for one complete raw reply line (engine API).
+
+        `t0` (monotonic) and `epoch` (wall clock) are taken just before the request was
+        sent. Empty `data` means EOF before any byte: recorded as "no_data", and the
+        connection is dropped.
+
+        The reply is parsed as bytes: float() accepts ASCII digits with surrounding
+        whitespace, so a valid reading needs no decode/strip. Only error replies are
+        decoded, to keep their text.
+        """
+
+        if not data:
+            self._disconnect()
             return Measurement(
                 ammeter=self.name,
                 timestamp_monotonic=t0,
                 wall_time_epoch=epoch,
                 value_a=None,
-                latency_s=time.monotonic() - t0,
+                latency_s=_monotonic() - t0,
                 ok=False,
-                error=repr(e),
+                error="no_data",
             )
+
+        try:
+            value = float(data)
+        except ValueError as e:
+            data = data.strip()
+            if data.startswith(b"ERROR:"):
+                return Measurement(
+                    ammeter=self.name,
+                    timestamp_monotonic=t0,
+                    wall_time_epoch=epoch,
+                    value_a=None,
+                    latency_s=_monotonic() - t0,
+                    ok=False,
+                    error=data.decode("utf-8", errors="replace"),
+                )
+            return self.failed(t0, epoch, e)
+        return Measurement(self.name, t0, epoch, value, _monotonic() - t0, True)
+
+    def failed(self, t0: float, epoch: float, error: BaseException) -> Measurement:
+        """Failed Measurement for an exchange that raised `error` (engine API).
+
+        Drops the connection, so the next exchange starts on a fresh one.
+        """
+
+        self._disconnect()
+        return Measurement(
+            ammeter=self.name,
+            timestamp_monotonic=t0,
+            wall_time_epoch=epoch,
+            value_a=None,
+            latency_s=_monotonic() - t0,
+            ok=False,
+            error=repr(error),
+        )
@@ -1,78 +1,141 @@
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Sequence, Union
 
-import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 from .unified_api import Measurement
-from .analysis import split_by_ammeter
+from .analysis import MeasurementColumns
 
 
-def _series_by_ammeter(measurements: List[Measurement]) -> Dict[str, List[float]]:
-    by = split_by_ammeter(measurements)
-    out: Dict[str, List[float]] = {}
-    for name, ms in by.items():
-        out[name] = [m.value_a for m in ms if m.ok and m.value_a is not None]
-    return out
+def _series_by_ammeter(measurements: List[Measurement]) -> Dict[str, np.ndarray]:
+    # Columnar pass + boolean masks; matplotlib takes the float64 arrays without re-coercing them.
+    return MeasurementColumns.from_measurements(measurements).ok_values()
 
 
-def plot_time_series(measurements: List[Measurement], out_dir: Path) -> None:
-    series = _series_by_ammeter(measurements)
-    if not series or all(len(vals) == 0 for vals in series.values()):
+# ammeter name -> ok values in sampling order (output of _series_by_ammeter)
+Series = Dict[str, np.ndarray]
+
+
+def _as_series(measurements: Union[List[Measurement], Series]) -> Series:
+    return measurements if isinstance(measurements, dict) else _series_by_ammeter(measurements)
+
+
+def _new_axes():
+    # Plain Figure + Agg canvas: no pyplot figure manager or GUI backend involved,
+    # and the figure is freed like any other object once saved.
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+
+def _box_stats(name: str, vals: np.ndarray) -> Dict[str, object]:
+    """Box-plot stats for Axes.bxp, same rules as Axes.boxplot (whiskers at 1.5 * IQR)."""
+
+    if vals.size == 0:
+        nan = float("nan")
+        return {"label": name, "med": nan, "q1": nan, "q3": nan, "whislo": nan, "whishi": nan, "fliers": vals}
+    q1, med, q3 = np.percentile(vals, [25, 50, 75])
+    iqr = q3 - q1
+    inside = vals[(vals >= q1 - 1.5 * iqr) & (vals <= q3 + 1.5 * iqr)]
+    return {
+        "label": name,
+        "med": med,
+        "q1": q1,
+        "q3": q3,
+        "whislo": inside.min(),
+        "whishi": inside.max(),
+        "fliers": vals[(vals < inside.min()) | (vals > inside.max())],
+    }
+
+
+def plot_time_series(measurements: Union[List[Measurement], Series], out_dir: Path) -> None:
+    series = _as_series(measurements)
+    if not series or all(vals.size == 0 for vals in series.values()):
         return
     out_dir.mkdir(parents=True, exist_ok=True)
-    plt.figure()
+    fig, ax = _new_axes()
     for name, vals in series.items():
-        plt.plot(list(range(len(vals))), vals, label=name)
-    plt.xlabel("sample")
-    plt.ylabel("current (A)")
-    plt.title("Current over time")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(out_dir / "time_series.png")
-    plt.close()
-
-
-def plot_histogram(measurements: List[Measurement], out_dir: Path) -> None:
-    series = _series_by_ammeter(measurements)
-    if not series or all(len(vals) == 0 for vals in series.values()):
+        ax.plot(np.arange(vals.size), vals, label=name)
+    ax.set_xlabel("sample")
+    ax.set_ylabel("current (A)")
+    ax.set_title("Current over time")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(out_dir / "time_series.png")
+
+
+def plot_histogram(measurements: Union[List[Measurement], Series], out_dir: Path) -> None:
+    series = _as_series(measurements)
+    if not series or all(vals.size == 0 for vals in series.values()):
         return
     out_dir.mkdir(parents=True, exist_ok=True)
-    plt.figure()
+    fig, ax = _new_axes()
     for name, vals in series.items():
-        if vals:
-            plt.hist(vals, bins=30, alpha=0.5, label=name)
-    plt.xlabel("current (A)")
-    plt.ylabel("count")
-    plt.title("Histogram")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(out_dir / "histogram.png")
-    plt.close()
-
-
-def plot_box(measurements: List[Measurement], out_dir: Path) -> None:
-    series = _series_by_ammeter(measurements)
-    if not series or all(len(vals) == 0 for vals in series.values()):
+        if vals.size:
+            # Bin in NumPy and draw the outline only; matplotlib never sees the raw samples.
+            counts, edges = np.histogram(vals, bins=30)
+            ax.stairs(counts, edges, fill=True, alpha=0.5, label=name)
+    ax.set_xlabel("current (A)")
+    ax.set_ylabel("count")
+    ax.set_title("Histogram")
+    ax.legend()
+    fig.tight_layout()
+    fig.savefig(out_dir / "histogram.png")
+
+
+def plot_box(measurements: Union[List[Measurement], Series], out_dir: Path) -> None:
+    series = _as_series(measurements)
+    if not series or all(vals.size == 0 for vals in series.values()):
         return
     out_dir.mkdir(parents=True, exist_ok=True)
-    names = list(series.keys())
-    vals = [series[n] for n in names]
-    plt.figure()
-    plt.boxplot(vals, labels=names, showfliers=True)
-    plt.ylabel("current (A)")
-    plt.title("Box plot")
-    plt.tight_layout()
-    plt.savefig(out_dir / "box_plot.png")
-    plt.close()
-
-
-def render_plots(measurements: List[Measurement], plot_types: List[str], out_dir: Path) -> None:
-    for p in plot_types:
-        if p == "time_series":
-            plot_time_series(measurements, out_dir)
-        elif p == "histogram":
-            plot_histogram(measurements, out_dir)
-        elif p == "box_plot":
-            plot_box(measurements, out_dir)
+    fig, ax = _new_axes()
+    # Quartiles/whiskers are computed with NumPy; bxp only draws them.
+    ax.bxp([_box_stats(name, vals) for name, vals in series.items()], showfliers=True)
+    ax.set_ylabel("current (A)")
+    ax.set_title("Box plot")
+    fig.tight_layout()
+    fig.savefig(out_dir / "box_plot.png")
+
+
+# Below this many readings, rendering inline beats starting worker processes.
+PARALLEL_MIN_MEASUREMENTS = 20_000
+
+_PLOTTERS = {
+    "time_series": plot_time_series,
+    "histogram": plot_histogram,
+    "box_plot": plot_box,
+}
+
+
+def _render_one(plot_type: str, series: Series, out_dir: Path) -> None:
+    _PLOTTERS[plot_type](series, out_dir)
+
+
+def render_plots(measurements: Union[List[Measurement], Series], plot_types: Sequence[str], out_dir: Path) -> None:
+    """Render the requested plots from raw measurements or already-grouped series.
+
+    Callers that have grouped the run (e.g. the runner, via group_values) should pass the
+    per-ammeter ok-value arrays so the measurements aren't grouped a second time.
+    """
+
+    todo = [p for p in plot_types if p in _PLOTTERS]
+    if not todo:
+        return
+    # Group once for all plots; the arrays are also cheap to pickle for the workers.
+    series = _as_series(measurements)
+    if len(todo) > 1 and sum(vals.size for vals in series.values()) >= PARALLEL_MIN_MEASUREMENTS:
+        # Agg rasterization is CPU-bound and holds the GIL, so large plots render in parallel processes.
+        # Spawned, not forked: emulator/sampler threads may be alive, and a forked child can
+        # deadlock on a lock one of them held.
+        with ProcessPoolExecutor(max_workers=len(todo), mp_context=multiprocessing.get_context("spawn")) as ex:
+            for f in [ex.submit(_render_one, p, series, out_dir) for p in todo]:
+                f.result()
+        return
+    for p in todo:
+        _render_one(p, series, out_dir)
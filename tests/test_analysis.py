@@ -0,0 +1,103 @@
+import math
+import statistics
+import unittest
+
+from framework.analysis import (
+    RunningStats,
+    compute_stats,
+    group_values,
+    pairwise_agreement,
+    reliability_ranking,
+    stats_by_ammeter,
+)
+from framework.unified_api import Measurement
+
+
+def _m(ammeter: str, value, ok: bool = True, error=None) -> Measurement:
+    return Measurement(
+        ammeter=ammeter,
+        timestamp_monotonic=0.0,
+        wall_time_epoch=0.0,
+        value_a=value,
+        latency_s=0.001,
+        ok=ok,
+        error=error,
+    )
+
+
+class TestAnalysis(unittest.TestCase):
+    def setUp(self):
+        self.xs = [1.0, 2.5, 3.0, 4.25, 7.0]
+        self.ys = [1.5, 2.0, 3.5, 4.0, 6.0, 9.0]
+        self.measurements = (
+            [_m("greenlee", v) for v in self.xs]
+            + [_m("greenlee", None, ok=False, error="fault_drop")]
+            + [_m("entes", v) for v in self.ys]
+        )
+
+    def test_compute_stats_matches_statistics_module(self):
+        s = compute_stats(self.xs)
+        self.assertEqual(s.count, len(self.xs))
+        self.assertAlmostEqual(s.mean, statistics.fmean(self.xs))
+        self.assertAlmostEqual(s.median, statistics.median(self.xs))
+        self.assertAlmostEqual(s.std_dev, statistics.pstdev(self.xs))
+        self.assertEqual(s.min, min(self.xs))
+        self.assertEqual(s.max, max(self.xs))
+
+    def test_compute_stats_empty(self):
+        s = compute_stats([])
+        self.assertEqual(s.count, 0)
+        self.assertIsNone(s.mean)
+
+    def test_compute_stats_total_count(self):
+        self.assertEqual(compute_stats(self.xs, count=9).count, 9)
+        s = compute_stats([], count=4)
+        self.assertEqual((s.count, s.ok_count), (4, 0))
+
+    def test_running_stats_matches_compute_stats(self):
+        rs = RunningStats()
+        for v in self.xs + [None]:
+            rs.add(v)
+        expected = compute_stats(self.xs, count=len(self.xs) + 1)
+        s = rs.to_stats(median=expected.median)
+        self.assertEqual((s.count, s.ok_count), (expected.count, expected.ok_count))
+        self.assertAlmostEqual(s.mean, expected.mean)
+        self.assertAlmostEqual(s.std_dev, expected.std_dev)
+        self.assertEqual((s.min, s.max), (expected.min, expected.max))
+
+        empty = RunningStats()
+        empty.add(None)
+        self.assertEqual(empty.to_stats(), compute_stats([], count=1))
+
+    def test_stats_by_ammeter_counts_failures(self):
+        stats = stats_by_ammeter(self.measurements)
+        self.assertEqual(stats["greenlee"].count, len(self.xs) + 1)
+        self.assertEqual(stats["greenlee"].ok_count, len(self.xs))
+        self.assertEqual(stats["entes"].count, len(self.ys))
+
+    def test_group_values(self):
+        groups = group_values(self.measurements)
+        total, vals = groups["greenlee"]
+        self.assertEqual(total, len(self.xs) + 1)
+        self.assertEqual(vals.tolist(), self.xs)
+        self.assertEqual(stats_by_ammeter(groups), stats_by_ammeter(self.measurements))
+        self.assertEqual(pairwise_agreement(groups), pairwise_agreement(self.measurements))
+
+    def test_pairwise_agreement(self):
+        ag = pairwise_agreement(self.measurements)[("entes", "greenlee")]
+        n = min(len(self.xs), len(self.ys))
+        xs, ys = self.ys[:n], self.xs[:n]
+        self.assertEqual(ag.paired_count, n)
+        self.assertAlmostEqual(ag.mae, statistics.fmean(abs(x - y) for x, y in zip(xs, ys)))
+        self.assertAlmostEqual(ag.rmse, math.sqrt(statistics.fmean((x - y) ** 2 for x, y in zip(xs, ys))))
+        self.assertAlmostEqual(ag.correlation, statistics.correlation(xs, ys))
+
+    def test_reliability_ranking_prefers_successful_ammeter(self):
+        stats = stats_by_ammeter(self.measurements)
+        ranking = reliability_ranking(stats, pairwise_agreement(self.measurements))
+        self.assertEqual(sorted(ranking), ["entes", "greenlee"])
+        self.assertEqual(ranking[0], "entes")
+
+
+if __name__ == "__main__":
+    unittest.main()
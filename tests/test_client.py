@@ -0,0 +1,71 @@
+import socket
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from Ammeters.client import request_many
+from framework.testing_util import start_emulators
+
+
+PORTS = {"greenlee": 6330, "entes": 6331, "circutor": 6332}
+
+
+def setUpModule():
+    start_emulators(PORTS)
+
+
+def _delayed_server(reply: bytes, delay_s: float) -> socket.socket:
+    """One-shot server that answers the first line with `reply` after `delay_s`."""
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+
+    def serve():
+        conn, _ = listener.accept()
+        with conn:
+            conn.makefile("rb").readline()
+            time.sleep(delay_s)
+            conn.sendall(reply)
+
+    threading.Thread(target=serve, daemon=True).start()
+    return listener
+
+
+class TestRequestMany(unittest.TestCase):
+    def test_replies_in_request_order(self):
+        items = [
+            (PORTS["circutor"], b"MEASURE_CIRCUTOR -get_measurement"),
+            (PORTS["greenlee"], b"NOT_A_COMMAND"),
+            (PORTS["entes"], b"MEASURE_ENTES -get_data"),
+            (PORTS["greenlee"], b"MEASURE_GREENLEE -get_measurement"),
+        ]
+        with redirect_stdout(StringIO()):
+            replies = request_many(items, host="127.0.0.1")
+
+        self.assertEqual(len(replies), len(items))
+        self.assertEqual(replies[1], "ERROR: Unsupported command")
+        for i in (0, 2, 3):
+            float(replies[i])
+
+    def test_order_kept_when_replies_arrive_out_of_order(self):
+        listeners = [_delayed_server(b"1\n", 0.3), _delayed_server(b"2\n", 0.0), _delayed_server(b"3\n", 0.15)]
+        for listener in listeners:
+            self.addCleanup(listener.close)
+        items = [(listener.getsockname()[1], b"MEASURE") for listener in listeners]
+
+        t0 = time.monotonic()
+        with redirect_stdout(StringIO()):
+            replies = request_many(items, host="127.0.0.1")
+
+        self.assertEqual(replies, ["1", "2", "3"])
+        self.assertLess(time.monotonic() - t0, 0.45)  # concurrent: about the slowest, not the sum
+
+    def test_empty(self):
+        self.assertEqual(request_many([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,23 +25,31 @@ Usage:
 
 import json
 import os
-import time
+import sys
 import unittest
 from pathlib import Path
-from collections import defaultdict
-
-from Ammeters.Circutor_Ammeter import CircutorAmmeter
-from Ammeters.Entes_Ammeter import EntesAmmeter
-from Ammeters.Greenlee_Ammeter import GreenleeAmmeter
+from collections import Counter
 
 from framework.config_loader import load_yaml, parse_config
+from framework.result_store import ResultStore, iter_measurement_records
 from framework.runner import run_project
-
-INIT_DELAY_SECONDS = 0.8
+from framework.testing_util import start_emulators
 
 CIRCUTOR_EMULATOR_NAME = "circutor"
 ENTES_EMULATOR_NAME = "entes"
 GREENLEE_EMULATOR_NAME = "greenlee"
+MAX_REPORTED_ERRORS = 20
+UNKNOWN_ERROR = "unknown"
+
+
+def _fast_exists(path) -> bool:
+    """Existence check as a single stat() call, without going through pathlib."""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        return False
+    return True
+
 
 class TestConfigDrivenFramework(unittest.TestCase):
     """Test the framework with configuration loaded from a YAML file."""
@@ -53,82 +61,117 @@ class TestConfigDrivenFramework(unittest.TestCase):
         cls.config_path = Path(config_path)
 
     @staticmethod
-    def _analyze_and_report_errors(measurements_file: Path) -> None:
+    def _scan_errors(measurements_file: Path):
         """
-        Load measurements from JSON file and report any errors to console.
+        Build the errors summary by streaming the measurements file (the fallback when
+        the run has no errors_summary.json).
         
-        Args:
-            measurements_file: Path to the measurements.json file
+        Returns:
+            Dict shaped like errors_summary.json, or None if the file can't be read
         """
-        if not measurements_file.exists():
-            return
-        
+        # Single pass: ok records come back as None without being parsed, and every
+        # failed record carries the full schema
+        total = 0
+        error_pairs = Counter()  # (error, ammeter) -> count: one update per failure
+        first_failed = []
         try:
-            with measurements_file.open("r", encoding="utf-8") as f:
-                measurements = json.load(f)
-        except (json.JSONDecodeError, IOError):
-            return
+            for total, m in enumerate(iter_measurement_records(measurements_file, skip_ok=True), start=1):
+                if m is None:
+                    continue
+                error = m["error"] or UNKNOWN_ERROR
+                ammeter = m["ammeter"]
+                error_pairs[error, ammeter] += 1
+                # Only the first MAX_REPORTED_ERRORS are printed, so only those are kept
+                if len(first_failed) < MAX_REPORTED_ERRORS:
+                    first_failed.append({
+                        "index": total - 1,
+                        "ammeter": ammeter,
+                        "error": error,
+                        "timestamp": m["wall_time_epoch"],
+                        "latency_s": m["latency_s"],
+                    })
+        except (ValueError, OSError):
+            return None
         
-        # Collect error statistics
-        error_count = 0
-        error_by_type = defaultdict(int)
-        error_by_ammeter = defaultdict(int)
-        failed_measurements = []
+        # Fold the few distinct pairs into the per-type and per-ammeter breakdowns
+        by_type = Counter()
+        by_ammeter = Counter()
+        for (error, ammeter), count in error_pairs.items():
+            by_type[error] += count
+            by_ammeter[ammeter] += count
+        return {
+            "total": total,
+            "failed": sum(error_pairs.values()),
+            "by_type": by_type,
+            "by_ammeter": by_ammeter,
+            "first_failed": first_failed,
+        }
+
+    @classmethod
+    def _analyze_and_report_errors(cls, measurements_file: Path) -> None:
+        """
+        Report measurement errors to console.
         
-        for i, measurement in enumerate(measurements):
-            if not measurement.get("ok", True):
-                error_count += 1
-                error_type = measurement.get("error", "unknown")
-                ammeter = measurement.get("ammeter", "unknown")
-                
-                error_by_type[error_type] += 1
-                error_by_ammeter[ammeter] += 1
-                
-                failed_measurements.append({
-                    "index": i,
-                    "ammeter": ammeter,
-                    "error": error_type,
-                    "timestamp": measurement.get("wall_time_epoch"),
-                    "latency_s": measurement.get("latency_s"),
-                })
+        Uses the errors_summary.json the runner writes next to the measurements, and
+        only scans the measurements file itself when that summary is missing.
         
-        # Print error report to console if there are errors
+        Args:
+            measurements_file: Path to measurements.json or .jsonl (a missing or
+                unreadable file is skipped)
+        """
+        try:
+            summary = json.loads(measurements_file.with_name("errors_summary.json").read_bytes())
+        except (OSError, ValueError):
+            summary = cls._scan_errors(measurements_file)
+            if summary is None:
+                return
+        
+        total = summary["total"]
+        error_count = summary["failed"]
+        error_by_type = summary["by_type"]
+        error_by_ammeter = summary["by_ammeter"]
+        failed_measurements = summary["first_failed"][:MAX_REPORTED_ERRORS]
+        
+        # Build the error report and print it with a single write
         if error_count > 0:
-            print("\n" + "=" * 80)
-            print("⚠️  MEASUREMENT ERROR REPORT")
-            print("=" * 80)
-            
-            print(f"\n📊 SUMMARY:")
-            print(f"   Total Errors: {error_count} / {len(measurements)} measurements")
-            print(f"   Error Rate: {100.0 * error_count / len(measurements):.2f}%")
-            
-            print(f"\n📈 ERRORS BY TYPE:")
-            for error_type in sorted(error_by_type.keys()):
-                count = error_by_type[error_type]
-                percentage = 100.0 * count / error_count
-                print(f"   - {error_type}: {count} ({percentage:.1f}%)")
+            out = [
+                "\n" + "=" * 80,
+                "⚠️  MEASUREMENT ERROR REPORT",
+                "=" * 80,
+                "\n📊 SUMMARY:",
+                f"   Total Errors: {error_count} / {total} measurements",
+                f"   Error Rate: {100.0 * error_count / total:.2f}%",
+                "\n📈 ERRORS BY TYPE:",
+            ]
+            out.extend(
+                f"   - {error_type}: {count} ({100.0 * count / error_count:.1f}%)"
+                for error_type, count in sorted(error_by_type.items())
+            )
             
-            print(f"\n🔧 ERRORS BY AMMETER:")
-            for ammeter in sorted(error_by_ammeter.keys()):
-                count = error_by_ammeter[ammeter]
-                percentage = 100.0 * count / error_count
-                print(f"   - {ammeter}: {count} ({percentage:.1f}%)")
+            out.append("\n🔧 ERRORS BY AMMETER:")
+            out.extend(
+                f"   - {ammeter}: {count} ({100.0 * count / error_count:.1f}%)"
+                for ammeter, count in sorted(error_by_ammeter.items())
+            )
             
-            print(f"\n📋 DETAILED ERRORS (first 20):")
-            for measurement in failed_measurements[:20]:
-                print(f"   [{measurement['index']:3d}] {measurement['ammeter']:10s} "
-                      f"error={measurement['error']:15s} latency={measurement['latency_s']:.3f}s")
+            out.append(f"\n📋 DETAILED ERRORS (first {MAX_REPORTED_ERRORS}):")
+            out.extend(
+                f"   [{m['index']:3d}] {m['ammeter']:10s} "
+                f"error={m['error']:15s} latency={m['latency_s']:.3f}s"
+                for m in failed_measurements
+            )
             
-            if len(failed_measurements) > 20:
-                print(f"   ... and {len(failed_measurements) - 20} more errors")
+            if error_count > MAX_REPORTED_ERRORS:
+                out.append(f"   ... and {error_count - MAX_REPORTED_ERRORS} more errors")
             
-            print("\n" + "=" * 80 + "\n")
+            out.append("\n" + "=" * 80 + "\n")
+            sys.stdout.write("\n".join(out) + "\n")
 
     def test_config_driven_framework(self):
 
         # Step 1: Verify config file exists
         self.assertTrue(
-            self.config_path.exists(),
+            _fast_exists(self.config_path),
             f"Config file not found: {self.config_path}",
         )
 
@@ -142,11 +185,10 @@ class TestConfigDrivenFramework(unittest.TestCase):
             ports[ammeter.name] = ammeter.port
 
         # Start emulators in separate threads
-        import threading
-        threading.Thread(target=GreenleeAmmeter(ports[GREENLEE_EMULATOR_NAME]).start_server, daemon=True).start()
-        threading.Thread(target=EntesAmmeter(ports[ENTES_EMULATOR_NAME]).start_server, daemon=True).start()
-        threading.Thread(target=CircutorAmmeter(ports[CIRCUTOR_EMULATOR_NAME]).start_server, daemon=True).start()
-        time.sleep(INIT_DELAY_SECONDS)
+        start_emulators({
+            name: ports[name]
+            for name in (GREENLEE_EMULATOR_NAME, ENTES_EMULATOR_NAME, CIRCUTOR_EMULATOR_NAME)
+        })
 
         # Verify that ports are from the config
         for ammeter in parsed_config.ammeters:
@@ -159,47 +201,55 @@ class TestConfigDrivenFramework(unittest.TestCase):
 
         # Step 3: Run the project
         run_dir = run_project(parsed_config, loaded_config)
+        # Plain string path for the os.* checks below (no Path objects per check)
+        rd = os.fspath(run_dir)
 
         # Step 4: Verify results were saved
         self.assertTrue(
-            run_dir.exists(),
+            os.path.isdir(rd),
             f"Run directory should exist: {run_dir}",
         )
 
-        self.assertTrue(
-            (run_dir / "summary.json").exists(),
+        # One directory listing instead of a stat per expected file
+        run_entries = {entry.name for entry in os.scandir(rd)}
+
+        self.assertIn(
+            "summary.json",
+            run_entries,
             "Summary file should be created",
         )
 
-        self.assertTrue(
-            (run_dir / "measurements.json").exists(),
+        # The measurements file name depends on the save format (json/csv/jsonl/binary)
+        measurements_file = ResultStore(parsed_config).measurements_path(run_dir)
+        self.assertIn(
+            measurements_file.name,
+            run_entries,
             "Measurements file should be created",
         )
 
         # Check if visualization is enabled and plots were created
         if parsed_config.analysis.visualization.enabled:
-            plots_dir = run_dir / "plots"
-            self.assertTrue(
-                plots_dir.exists(),
+            self.assertIn(
+                "plots",
+                run_entries,
                 "Plots directory should be created when visualization is enabled",
             )
             # Check that at least one plot file exists
-            plot_files = list(plots_dir.glob("*.png"))
+            plot_files = [entry.name for entry in os.scandir(os.path.join(rd, "plots")) if entry.name.endswith(".png")]
             self.assertTrue(
                 len(plot_files) > 0,
                 "At least one plot file should be generated",
             )
 
         # Verify results are saved in the configured format
-        save_format = parsed_config.results.save_format
-        if save_format == "json":
-            self.assertTrue(
-                (run_dir / "measurements.json").exists(),
+        if parsed_config.results.save_format == "json":
+            self.assertIn(
+                "measurements.json",
+                run_entries,
                 "Measurements should be saved in JSON format",
             )
         
         # Analyze and report any measurement errors at the end
-        measurements_file = run_dir / "measurements.json"
         self._analyze_and_report_errors(measurements_file)
 
 
@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from framework.config_loader import load_yaml, parse_config
+
+CONFIG_PATH = Path("configs/sample_quick.yaml")
+
+
+class TestConfigLoader(unittest.TestCase):
+    def test_load_yaml_returns_independent_copies(self):
+        first = load_yaml(CONFIG_PATH)
+        first["testing"]["sampling"]["measurements_count"] = -1
+        second = load_yaml(CONFIG_PATH)
+        self.assertNotEqual(second["testing"]["sampling"]["measurements_count"], -1)
+
+    def test_load_yaml_sees_file_changes(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "cfg.yaml"
+            path.write_text("a: 1\n", encoding="utf-8")
+            self.assertEqual(load_yaml(path), {"a": 1})
+            path.write_text("a: 22\n", encoding="utf-8")  # size changes, so the cache entry is stale
+            self.assertEqual(load_yaml(path), {"a": 22})
+
+    def test_load_yaml_sees_same_size_rewrite(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "cfg.yaml"
+            path.write_text("a: 1\n", encoding="utf-8")
+            self.assertEqual(load_yaml(path), {"a": 1})
+            mtime_ns = path.stat().st_mtime_ns
+            path.write_text("a: 2\n", encoding="utf-8")
+            os.utime(path, ns=(mtime_ns + 1, mtime_ns + 1))  # same size, mtime differs by 1 ns
+            self.assertEqual(load_yaml(path), {"a": 2})
+
+    def test_load_yaml_missing_file(self):
+        with self.assertRaisesRegex(FileNotFoundError, "Config file not found"):
+            load_yaml(Path("configs/does_not_exist.yaml"))
+
+    def test_parse_config_is_memoized_and_immutable(self):
+        raw = load_yaml(CONFIG_PATH)
+        cfg = parse_config(raw)
+        self.assertIs(parse_config(load_yaml(CONFIG_PATH)), cfg)
+        self.assertIs(parse_config(dict(reversed(list(raw.items())))), cfg)
+        self.assertIsInstance(cfg.ammeters, tuple)
+        self.assertEqual([a.name for a in cfg.ammeters], ["greenlee", "entes", "circutor"])
+        self.assertEqual(cfg.ammeters[0].command, b"MEASURE_GREENLEE -get_measurement")
+
+        raw["testing"]["sampling"]["measurements_count"] = 99
+        self.assertEqual(parse_config(raw).sampling.measurements_count, 99)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import socket
+import unittest
+
+from framework.config_loader import DatadogCfg
+from framework.datadog_metrics import MAX_DATAGRAM_BYTES, DogStatsd
+
+
+class TestDogStatsd(unittest.TestCase):
+    def setUp(self):
+        # Local UDP "agent" to capture what the client puts on the wire.
+        self.agent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.agent.bind(("127.0.0.1", 0))
+        self.agent.settimeout(1.0)
+        self.dd = DogStatsd(DatadogCfg(enabled=True, host="127.0.0.1", port=self.agent.getsockname()[1]))
+
+    def tearDown(self):
+        self.agent.close()
+
+    def _received_lines(self):
+        return self.agent.recv(65535).split(b"\n")
+
+    def test_wire_format(self):
+        self.dd.gauge("current_a", 1.25, tags={"ammeter": "entes"})
+        self.dd.flush()
+        self.assertEqual(self._received_lines(), [b"ammeter_test.current_a:1.25|g|#ammeter:entes"])
+
+        self.dd.increment("measure_ok")
+        self.dd.flush()
+        self.assertEqual(self._received_lines(), [b"ammeter_test.measure_ok:1|c"])
+
+        self.dd.timing("latency_ms", 0.5, tags={"a": "b", "c": "d"})
+        self.dd.flush()
+        self.assertEqual(self._received_lines(), [b"ammeter_test.latency_ms:0.5|ms|#a:b,c:d"])
+
+    def test_metrics_are_batched_per_datagram(self):
+        self.dd.gauge("current_a", 1.0)
+        self.dd.increment("measure_ok")
+        self.dd.flush()
+        self.assertEqual(
+            self._received_lines(),
+            [b"ammeter_test.current_a:1.0|g", b"ammeter_test.measure_ok:1|c"],
+        )
+
+    def test_tagged_emitter_matches_tags_argument(self):
+        emitter = self.dd.for_tags({"ammeter": "entes"})
+        emitter.gauge("current_a", 2.5)
+        emitter.increment("measure_error")
+        emitter.timing("latency_ms", 1.5)
+        self.dd.flush()
+        self.assertEqual(
+            self._received_lines(),
+            [
+                b"ammeter_test.current_a:2.5|g|#ammeter:entes",
+                b"ammeter_test.measure_error:1|c|#ammeter:entes",
+                b"ammeter_test.latency_ms:1.5|ms|#ammeter:entes",
+            ],
+        )
+
+    def test_record_measurement(self):
+        emitter = self.dd.for_tags({"ammeter": "entes"})
+        emitter.record_measurement(2.5, 1.5)
+        emitter.record_measurement(None, 3.0)
+        self.dd.flush()
+        self.assertEqual(
+            self._received_lines(),
+            [
+                b"ammeter_test.current_a:2.5|g|#ammeter:entes",
+                b"ammeter_test.measure_ok:1|c|#ammeter:entes",
+                b"ammeter_test.latency_ms:1.5|ms|#ammeter:entes",
+                b"ammeter_test.measure_error:1|c|#ammeter:entes",
+                b"ammeter_test.latency_ms:3.0|ms|#ammeter:entes",
+            ],
+        )
+
+    def test_full_buffer_is_sent_early(self):
+        for _ in range(200):
+            self.dd.increment("measure_ok", tags={"ammeter": "greenlee"})
+        self.dd.flush()
+
+        total = 0
+        while total < 200:
+            datagram = self.agent.recv(65535)
+            self.assertLessEqual(len(datagram), MAX_DATAGRAM_BYTES)
+            total += len(datagram.split(b"\n"))
+        self.assertEqual(total, 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import socket
+import time
+import unittest
+from unittest import mock
+
+from Ammeters.Circutor_Ammeter import CircutorAmmeter
+from framework.testing_util import start_emulators
+
+
+PORT = 6320
+
+
+def setUpModule():
+    start_emulators({"entes": PORT})
+
+
+class TestEmulatorFraming(unittest.TestCase):
+    def _connect(self):
+        conn = socket.create_connection(("127.0.0.1", PORT), timeout=2.0)
+        self.addCleanup(conn.close)
+        return conn, conn.makefile("rb")
+
+    def test_command_split_across_segments(self):
+        conn, f = self._connect()
+        conn.sendall(b"MEASURE_ENTES")
+        time.sleep(0.05)  # arrives as a separate segment
+        conn.sendall(b" -get_data\n")
+        float(f.readline())
+
+        # Still in sync: the next command gets exactly its own reply
+        conn.sendall(b"NOT_A_COMMAND\n")
+        self.assertEqual(f.readline(), b"ERROR: Unsupported command\n")
+
+    def test_unframed_command_answered_after_idle(self):
+        conn, f = self._connect()
+        conn.sendall(b"MEASURE_ENTES -get_data")
+        float(f.readline())
+
+    def test_oversized_command_rejected(self):
+        conn, f = self._connect()
+        conn.sendall(b"x" * 2000)
+        self.assertEqual(f.readline(), b"ERROR: Command too long\n")
+        self.assertEqual(f.readline(), b"")  # connection closed
+
+
+class TestCircutorRng(unittest.TestCase):
+    def test_each_instance_has_its_own_generator(self):
+        a, b = CircutorAmmeter(0), CircutorAmmeter(0)
+        self.assertIsNot(a._np_rng, b._np_rng)
+
+        with mock.patch("builtins.print"):
+            current = a.measure_current()
+        # time_step in [0.001, 0.01) s times the sum of 10 voltages in [0.1, 1.0) V
+        self.assertTrue(0.001 * 1.0 <= current < 0.01 * 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
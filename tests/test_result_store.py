@@ -0,0 +1,90 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from framework.config_loader import parse_config
+from framework.result_store import ResultStore, iter_measurement_records, measurement_to_dict
+from framework.unified_api import Measurement
+
+
+MEASUREMENTS = [
+    Measurement("greenlee", 1.0, 100.0, 0.5, 0.01, True),
+    Measurement("entes", 1.1, 100.1, None, 0.02, False, "ERROR: Unsupported command"),
+]
+
+
+def _store(save_path: Path, save_format: str) -> ResultStore:
+    return ResultStore(parse_config({
+        "ammeters": {"greenlee": {"port": 6300, "command": "MEASURE_GREENLEE -get_measurement"}},
+        "result_management": {"save_path": str(save_path), "save_format": save_format},
+    }))
+
+
+class TestMeasurementsJson(unittest.TestCase):
+    def setUp(self):
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        self.dir = Path(td.name)
+
+    def test_written_file_is_a_json_array_and_streams(self):
+        _store(self.dir, "json").write_measurements(self.dir, MEASUREMENTS)
+        path = self.dir / "measurements.json"
+        expected = [measurement_to_dict(m) for m in MEASUREMENTS]
+
+        self.assertEqual(json.loads(path.read_text(encoding="utf-8")), expected)
+        self.assertEqual(list(iter_measurement_records(path)), expected)
+
+    def test_empty_run(self):
+        _store(self.dir, "json").write_measurements(self.dir, [])
+        path = self.dir / "measurements.json"
+
+        self.assertEqual(json.loads(path.read_text(encoding="utf-8")), [])
+        self.assertEqual(list(iter_measurement_records(path)), [])
+
+    def test_other_layouts_fall_back_to_full_parse(self):
+        expected = [measurement_to_dict(m) for m in MEASUREMENTS]
+        path = self.dir / "measurements.json"
+        path.write_text(json.dumps(expected, indent=2), encoding="utf-8")
+
+        self.assertEqual(list(iter_measurement_records(path)), expected)
+
+    def test_skip_ok_yields_none_for_successful_records(self):
+        _store(self.dir, "json").write_measurements(self.dir, MEASUREMENTS)
+        path = self.dir / "measurements.json"
+
+        records = list(iter_measurement_records(path, skip_ok=True))
+        self.assertEqual(records, [None, measurement_to_dict(MEASUREMENTS[1])])
+
+        # Same contract for layouts that need the full parse
+        path.write_text(json.dumps(json.loads(path.read_text(encoding="utf-8")), indent=2), encoding="utf-8")
+        self.assertEqual(list(iter_measurement_records(path, skip_ok=True)), records)
+
+    def test_skip_ok_handles_non_compact_jsonl(self):
+        path = self.dir / "measurements.jsonl"
+        expected = [measurement_to_dict(m) for m in MEASUREMENTS]
+        # Default stdlib separators: '"ok": true', which the byte fast path doesn't match
+        path.write_text("".join(json.dumps(r) + "\n" for r in expected), encoding="utf-8")
+
+        self.assertEqual(list(iter_measurement_records(path, skip_ok=True)), [None, expected[1]])
+
+    def test_measurements_path_per_format(self):
+        for fmt, name in [("json", "measurements.json"), ("csv", "measurements.csv"),
+                          ("jsonl", "measurements.jsonl"), ("binary", "measurements")]:
+            with self.subTest(fmt):
+                self.assertEqual(_store(self.dir, fmt).measurements_path(self.dir), self.dir / name)
+
+
+class TestConfigSnapshot(unittest.TestCase):
+    def test_typed_config_is_written_when_raw_yaml_is_absent(self):
+        with tempfile.TemporaryDirectory() as td:
+            run_dir = Path(td)
+            _store(run_dir, "json").write_config_snapshot(run_dir)
+            snapshot = json.loads((run_dir / "config.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(snapshot["ammeters"][0]["command"], "MEASURE_GREENLEE -get_measurement")
+        self.assertEqual(snapshot["results"]["save_path"], str(run_dir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+import json
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from framework.analysis import stats_by_ammeter
+from framework.async_sampler import AsyncSampler
+from framework.config_loader import SamplingCfg
+from framework.result_store import ColumnarSink, JsonlSink, load_run
+from framework.sampler import SampleStore, Sampler
+from framework.selector_sampler import SelectorSampler
+from framework.testing_util import start_emulators
+from framework.unified_api import AmmeterClient, Measurement
+
+
+PORTS = {"greenlee": 6200, "entes": 6201}
+CLOSED_PORT = 6209  # nothing listens here
+
+
+def setUpModule():
+    start_emulators(PORTS)
+
+
+def _truncating_server():
+    """Listener that answers every request with an unterminated number and hangs up."""
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            with conn:
+                conn.makefile("rb").readline()
+                conn.sendall(b"12")  # "123.4\n" cut off
+
+    threading.Thread(target=serve, daemon=True).start()
+    return listener
+
+
+def _clients():
+    return [
+        AmmeterClient("greenlee", "127.0.0.1", PORTS["greenlee"], b"MEASURE_GREENLEE -get_measurement"),
+        AmmeterClient("entes", "127.0.0.1", PORTS["entes"], b"MEASURE_ENTES -get_data"),
+        AmmeterClient("bad_command", "127.0.0.1", PORTS["entes"], b"NOT_A_COMMAND"),
+        AmmeterClient("offline", "127.0.0.1", CLOSED_PORT, b"MEASURE_ENTES -get_data", timeout_s=0.5),
+    ]
+
+
+class TestSamplers(unittest.TestCase):
+    def _run(self, sampler_cls):
+        sampling = SamplingCfg(measurements_count=3, total_duration_seconds=None, sampling_frequency_hz=20)
+        return sampler_cls(clients=_clients(), sampling=sampling).run().to_measurements()
+
+    def _check(self, measurements):
+        self.assertEqual(
+            [m.ammeter for m in measurements],
+            ["greenlee", "entes", "bad_command", "offline"] * 3,
+        )
+        by_name = {}
+        for m in measurements:
+            by_name.setdefault(m.ammeter, []).append(m)
+        for name in ("greenlee", "entes"):
+            self.assertTrue(all(m.ok and m.value_a is not None for m in by_name[name]))
+        self.assertTrue(all(m.error == "ERROR: Unsupported command" for m in by_name["bad_command"]))
+        self.assertTrue(all(not m.ok and m.error for m in by_name["offline"]))
+
+    def test_threaded_sampler(self):
+        self._check(self._run(Sampler))
+
+    def test_selector_sampler(self):
+        self._check(self._run(SelectorSampler))
+
+    def test_async_sampler(self):
+        self._check(self._run(AsyncSampler))
+
+    def _check_truncated(self, sampler_cls):
+        listener = _truncating_server()
+        self.addCleanup(listener.close)
+        client = AmmeterClient("cut", "127.0.0.1", listener.getsockname()[1], b"MEASURE")
+        sampling = SamplingCfg(measurements_count=2, total_duration_seconds=None, sampling_frequency_hz=20)
+
+        for m in sampler_cls(clients=[client], sampling=sampling).run().iter_measurements():
+            self.assertFalse(m.ok)
+            self.assertIsNone(m.value_a)
+            self.assertIn("truncated reply", m.error)
+
+    def test_truncated_reply_threads(self):
+        self._check_truncated(Sampler)
+
+    def test_truncated_reply_selector(self):
+        self._check_truncated(SelectorSampler)
+
+    def test_truncated_reply_asyncio(self):
+        self._check_truncated(AsyncSampler)
+
+    def test_running_stats_match_post_pass(self):
+        sampling = SamplingCfg(measurements_count=4, total_duration_seconds=None, sampling_frequency_hz=20)
+        sampler = Sampler(clients=_clients(), sampling=sampling)
+        expected = stats_by_ammeter(sampler.run().to_measurements())
+        stats = sampler.stats()
+
+        self.assertEqual(list(stats), list(expected))
+        for name, s in stats.items():
+            e = expected[name]
+            self.assertEqual((s.count, s.ok_count, s.median, s.min, s.max), (e.count, e.ok_count, e.median, e.min, e.max))
+            if e.mean is None:
+                self.assertIsNone(s.mean)
+            else:
+                self.assertAlmostEqual(s.mean, e.mean)
+                self.assertAlmostEqual(s.std_dev, e.std_dev)
+
+    def test_streams_batches_to_sink(self):
+        sampling = SamplingCfg(measurements_count=3, total_duration_seconds=None, sampling_frequency_hz=20)
+        with tempfile.TemporaryDirectory() as td:
+            sink = JsonlSink(Path(td) / "measurements.jsonl")
+            try:
+                measurements = Sampler(clients=_clients(), sampling=sampling, sink=sink, sink_batch_size=5).run().to_measurements()
+            finally:
+                sink.close()
+            lines = sink.path.read_text(encoding="utf-8").splitlines()
+
+        self.assertEqual(len(lines), len(measurements))
+        self.assertEqual([json.loads(line)["ammeter"] for line in lines], [m.ammeter for m in measurements])
+
+    def test_sink_error_does_not_mask_sampling_error(self):
+        class BrokenSink:
+            def write(self, batch):
+                raise OSError("disk full")
+
+        class Interrupted(Exception):
+            pass
+
+        sampling = SamplingCfg(measurements_count=3, total_duration_seconds=None, sampling_frequency_hz=20)
+        sampler = Sampler(clients=_clients(), sampling=sampling, sink=BrokenSink(), sink_batch_size=100)
+        poll = sampler._poll_tick
+        ticks = []
+
+        def failing_poll():
+            if ticks:
+                raise Interrupted()
+            ticks.append(1)
+            return poll()
+
+        sampler._poll_tick = failing_poll
+        with self.assertRaises(Interrupted):
+            sampler.run()
+
+    def test_columnar_sink_round_trip(self):
+        sampling = SamplingCfg(measurements_count=3, total_duration_seconds=None, sampling_frequency_hz=20)
+        with tempfile.TemporaryDirectory() as td:
+            sink = ColumnarSink(Path(td) / "measurements")
+            try:
+                measurements = Sampler(clients=_clients(), sampling=sampling, sink=sink, sink_batch_size=5).run().to_measurements()
+            finally:
+                sink.close()
+            run = load_run(sink.path)
+
+        self.assertEqual([run["codes"][k] for k in run["ammeter_code"]], [m.ammeter for m in measurements])
+        self.assertEqual(run["ok"].tolist(), [m.ok for m in measurements])
+        self.assertEqual(run["ts"].tolist(), [m.timestamp_monotonic for m in measurements])
+        self.assertEqual(
+            [None if v != v else v for v in run["val"].tolist()],
+            [m.value_a for m in measurements],
+        )
+        self.assertEqual(run["errors"], {i: m.error for i, m in enumerate(measurements) if m.error is not None})
+
+
+class TestSampleStore(unittest.TestCase):
+    def test_round_trip_and_growth(self):
+        ms = [
+            Measurement("a", 1.0, 100.0, 0.5, 0.01, True),
+            Measurement("b", 1.1, 100.1, None, 0.02, False, "no_data"),
+            Measurement("a", 2.0, 101.0, 0.25, 0.03, True),
+        ]
+        store = SampleStore(capacity=1)
+        for m in ms:
+            store.append(m)
+
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.to_measurements(), ms)
+        self.assertEqual(list(store.iter_measurements(block_rows=2)), ms)
+
+        cols = store.columns()
+        self.assertEqual(cols.names, ["a", "b"])
+        self.assertEqual(cols.totals().tolist(), [2, 1])
+        self.assertEqual(cols.ok_values()["a"].tolist(), [0.5, 0.25])
+
+    def test_error_summary(self):
+        store = SampleStore()
+        for m in (
+            Measurement("a", 1.0, 100.0, 0.5, 0.01, True),
+            Measurement("b", 1.1, 100.1, None, 0.02, False, "no_data"),
+            Measurement("a", 2.0, 101.0, None, 0.03, False, "no_data"),
+            Measurement("b", 2.1, 101.1, None, 0.04, False, "ERROR: Unsupported command"),
+        ):
+            store.append(m)
+
+        summary = store.error_summary(max_failed=2)
+        self.assertEqual(summary["total"], 4)
+        self.assertEqual(summary["failed"], 3)
+        self.assertEqual(summary["by_type"], {"no_data": 2, "ERROR: Unsupported command": 1})
+        self.assertEqual(summary["by_ammeter"], {"a": 1, "b": 2})
+        self.assertEqual(
+            summary["first_failed"],
+            [
+                {"index": 1, "ammeter": "b", "error": "no_data", "timestamp": 100.1, "latency_s": 0.02},
+                {"index": 2, "ammeter": "a", "error": "no_data", "timestamp": 101.0, "latency_s": 0.03},
+            ],
+        )
+        json.dumps(summary)  # plain Python types only
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,38 +1,29 @@
+import os
 import tempfile
-import time
 import unittest
 from pathlib import Path
 
-import yaml
-
-from Ammeters.Circutor_Ammeter import CircutorAmmeter
-from Ammeters.Entes_Ammeter import EntesAmmeter
-from Ammeters.Greenlee_Ammeter import GreenleeAmmeter
-
-from framework.config_loader import load_yaml, parse_config
+from framework.config_loader import parse_config
 from framework.runner import run_project
+from framework.testing_util import start_emulators
 
+# Use non-default ports to avoid conflicts if user already runs main.py
+PORTS = {
+    "greenlee": 6100,
+    "entes": 6101,
+    "circutor": 6102,
+}
 
-class TestSmokeFramework(unittest.TestCase):
-    def test_end_to_end(self):
-        # Use non-default ports to avoid conflicts if user already runs main.py
-        ports = {
-            "greenlee": 6100,
-            "entes": 6101,
-            "circutor": 6102,
-        }
 
-        # Start emulators
-        import threading
+def setUpModule():
+    # Started once for the module; start_emulators() reuses them on later calls.
+    start_emulators(PORTS)
 
-        threading.Thread(target=GreenleeAmmeter(ports["greenlee"]).start_server, daemon=True).start()
-        threading.Thread(target=EntesAmmeter(ports["entes"]).start_server, daemon=True).start()
-        threading.Thread(target=CircutorAmmeter(ports["circutor"]).start_server, daemon=True).start()
-        time.sleep(0.8)
 
+class TestSmokeFramework(unittest.TestCase):
+    def test_end_to_end(self):
         with tempfile.TemporaryDirectory() as td:
             td = Path(td)
-            cfg_path = td / "cfg.yaml"
             out_dir = td / "results"
             raw = {
                 "testing": {
@@ -43,9 +34,9 @@ class TestSmokeFramework(unittest.TestCase):
                     }
                 },
                 "ammeters": {
-                    "greenlee": {"port": ports["greenlee"], "command": "MEASURE_GREENLEE -get_measurement"},
-                    "entes": {"port": ports["entes"], "command": "MEASURE_ENTES -get_data"},
-                    "circutor": {"port": ports["circutor"], "command": "MEASURE_CIRCUTOR -get_measurement"},
+                    "greenlee": {"port": PORTS["greenlee"], "command": "MEASURE_GREENLEE -get_measurement"},
+                    "entes": {"port": PORTS["entes"], "command": "MEASURE_ENTES -get_data"},
+                    "circutor": {"port": PORTS["circutor"], "command": "MEASURE_CIRCUTOR -get_measurement"},
                 },
                 "analysis": {
                     "statistical_metrics": ["mean", "median", "std_dev", "min", "max"],
@@ -58,15 +49,15 @@ class TestSmokeFramework(unittest.TestCase):
                 },
             }
 
-            cfg_path.write_text(yaml.safe_dump(raw), encoding="utf-8")
-
-            loaded = load_yaml(cfg_path)
-            cfg = parse_config(loaded)
-            run_dir = run_project(cfg, loaded)
+            # parse_config takes the mapping directly; no need to round-trip it through YAML
+            cfg = parse_config(raw)
+            rd = os.fspath(run_project(cfg))
 
-            self.assertTrue((run_dir / "summary.json").exists())
-            self.assertTrue((run_dir / "measurements.json").exists())
-            self.assertTrue((run_dir / "plots" / "time_series.png").exists())
+            run_entries = {entry.name for entry in os.scandir(rd)}
+            self.assertIn("summary.json", run_entries)
+            self.assertIn("config.json", run_entries)
+            self.assertIn("measurements.json", run_entries)
+            self.assertIn("time_series.png", {entry.name for entry in os.scandir(os.path.join(rd, "plots"))})
 
 
 if __name__ == "__main__":
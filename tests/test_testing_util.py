@@ -0,0 +1,55 @@
+import socket
+import time
+import unittest
+
+from framework.testing_util import start_emulators, wait_for_ports
+from framework.unified_api import AmmeterClient
+
+
+class TestWaitForPorts(unittest.TestCase):
+    def test_returns_once_listening(self):
+        listeners = []
+        for _ in range(2):
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.bind(("127.0.0.1", 0))
+            s.listen()
+            self.addCleanup(s.close)
+            listeners.append(s)
+
+        wait_for_ports([s.getsockname()[1] for s in listeners], timeout=1.0)
+
+    def test_times_out_on_closed_port(self):
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+        s.close()  # nothing listens on it any more
+
+        t0 = time.monotonic()
+        with self.assertRaises(TimeoutError) as ctx:
+            wait_for_ports([port], timeout=0.2)
+        self.assertLess(time.monotonic() - t0, 1.0)
+        self.assertIn(str(port), str(ctx.exception))
+
+
+class TestStartEmulators(unittest.TestCase):
+    def test_emulator_answers_once_started(self):
+        start_emulators({"entes": 6310})
+
+        client = AmmeterClient("entes", "127.0.0.1", 6310, b"MEASURE_ENTES -get_data")
+        self.addCleanup(client.close)
+        self.assertTrue(client.measure().ok)
+
+    def test_second_start_reuses_running_emulator(self):
+        start_emulators({"entes": 6311})
+
+        t0 = time.monotonic()
+        start_emulators({"entes": 6311})  # would fail to bind if started again
+        self.assertLess(time.monotonic() - t0, 0.5)
+
+    def test_unknown_emulator(self):
+        with self.assertRaises(ValueError):
+            start_emulators({"fluke": 6399})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import socket
+import threading
+import time
+import unittest
+
+from framework.unified_api import RECV_BYTES, AmmeterClient
+
+
+def _serve(listener, replies):
+    """Answer each received line with the next reply, sent in the given pieces."""
+
+    conn, _ = listener.accept()
+    with conn:
+        f = conn.makefile("rb")
+        for pieces in replies:
+            if not f.readline():
+                return
+            for piece in pieces:
+                conn.sendall(piece)
+                time.sleep(0.05)
+        if replies and not replies[-1][-1].endswith(b"\n"):
+            return  # the last reply is cut off by closing the connection
+        f.readline()  # read the next request before closing, so the client sees EOF rather than a reset
+
+
+class TestAmmeterClient(unittest.TestCase):
+    def _client_for(self, replies):
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        self.addCleanup(listener.close)
+        threading.Thread(target=_serve, args=(listener, replies), daemon=True).start()
+        client = AmmeterClient("fake", "127.0.0.1", listener.getsockname()[1], b"MEASURE")
+        self.addCleanup(client.close)
+        return client
+
+    def test_reply_split_across_reads(self):
+        client = self._client_for([[b"1.23", b"45\n"], [b"0.5\n"]])
+
+        first = client.measure()
+        self.assertTrue(first.ok)
+        self.assertEqual(first.value_a, 1.2345)
+        self.assertEqual(client.measure().value_a, 0.5)
+
+    def test_reply_longer_than_buffer(self):
+        reason = "x" * (2 * RECV_BYTES)
+        client = self._client_for([[f"ERROR: {reason}\n".encode()]])
+
+        m = client.measure()
+        self.assertFalse(m.ok)
+        self.assertEqual(m.error, f"ERROR: {reason}")
+
+    def test_closed_connection(self):
+        client = self._client_for([])
+
+        m = client.measure()
+        self.assertFalse(m.ok)
+        self.assertEqual(m.error, "no_data")
+
+    def test_truncated_reply_is_an_error(self):
+        client = self._client_for([[b"12"]])  # "123.4\n" cut off by the server closing
+
+        m = client.measure()
+        self.assertFalse(m.ok)
+        self.assertIsNone(m.value_a)
+        self.assertIn("truncated reply", m.error)
+        self.assertIsNone(client._sock)
+
+
+if __name__ == "__main__":
+    unittest.main()
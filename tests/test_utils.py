@@ -0,0 +1,93 @@
+import copy
+import tempfile
+import unittest
+from pathlib import Path
+
+from Utiles import Utils
+
+
+VALID = {
+    "ammeters": {"greenlee": {"port": 5000, "command": "MEASURE_GREENLEE -get_measurement"}},
+    "testing": {"sampling": {"sampling_frequency_hz": 10, "measurements_count": 5}},
+}
+
+
+def _invalid_configs():
+    """(description, config) pairs that both validators must reject."""
+
+    def without(path):
+        cfg = copy.deepcopy(VALID)
+        *parents, key = path
+        node = cfg
+        for p in parents:
+            node = node[p]
+        del node[key]
+        return cfg
+
+    def replaced(path, value):
+        cfg = copy.deepcopy(VALID)
+        *parents, key = path
+        node = cfg
+        for p in parents:
+            node = node[p]
+        node[key] = value
+        return cfg
+
+    return [
+        ("no ammeters", without(["ammeters"])),
+        ("ammeters not a mapping", replaced(["ammeters"], ["greenlee"])),
+        ("no testing", without(["testing"])),
+        ("no sampling", without(["testing", "sampling"])),
+        ("no frequency", without(["testing", "sampling", "sampling_frequency_hz"])),
+        ("no stop condition", without(["testing", "sampling", "measurements_count"])),
+        ("ammeter not a mapping", replaced(["ammeters", "greenlee"], 5000)),
+        ("no port", without(["ammeters", "greenlee", "port"])),
+        ("no command", without(["ammeters", "greenlee", "command"])),
+    ]
+
+
+class TestHandWrittenSchemaChecks(unittest.TestCase):
+    def test_valid(self):
+        Utils._check_config_schema(VALID)
+        Utils._check_config_schema(
+            {**VALID, "testing": {"sampling": {"sampling_frequency_hz": 10, "total_duration_seconds": 1}}}
+        )
+
+    def test_invalid(self):
+        for desc, cfg in _invalid_configs():
+            with self.subTest(desc), self.assertRaises(ValueError):
+                Utils._check_config_schema(cfg)
+
+
+@unittest.skipUnless(Utils.fastjsonschema, "fastjsonschema not installed")
+class TestCompiledSchema(unittest.TestCase):
+    def test_valid(self):
+        Utils._COMPILED_SCHEMA(VALID)
+        Utils.validate_config_schema(VALID)
+
+    def test_invalid_matches_hand_written_checks(self):
+        for desc, cfg in _invalid_configs():
+            with self.subTest(desc):
+                with self.assertRaises(Utils.fastjsonschema.JsonSchemaException):
+                    Utils._COMPILED_SCHEMA(cfg)
+                with self.assertRaises(ValueError) as compiled:
+                    Utils.validate_config_schema(cfg)
+                with self.assertRaises(ValueError) as plain:
+                    Utils._check_config_schema(cfg)
+                self.assertEqual(str(compiled.exception), str(plain.exception))
+
+
+class TestLoadConfig(unittest.TestCase):
+    def test_missing_file_gives_empty_config(self):
+        with tempfile.TemporaryDirectory() as td:
+            self.assertEqual(Utils.load_config(Path(td) / "missing.yaml"), {})
+
+    def test_reads_file(self):
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "cfg.yaml"
+            path.write_text("ammeters:\n  greenlee:\n    port: 5000\n", encoding="utf-8")
+            self.assertEqual(Utils.load_config(path), {"ammeters": {"greenlee": {"port": 5000}}})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from framework import visualization
+from framework.unified_api import Measurement
+
+
+PLOT_TYPES = ["time_series", "histogram", "box_plot"]
+
+
+def _measurements():
+    out = []
+    for i in range(20):
+        out.append(Measurement("greenlee", float(i), 1000.0 + i, 1.0 + i / 10, 0.001, True))
+        out.append(Measurement("entes", float(i), 1000.0 + i, 2.0 - i / 10, 0.001, True))
+        out.append(Measurement("circutor", float(i), 1000.0 + i, None, 0.001, False, "no_data"))
+    return out
+
+
+class TestRenderPlots(unittest.TestCase):
+    def _render(self):
+        with tempfile.TemporaryDirectory() as td:
+            out_dir = Path(td) / "plots"
+            visualization.render_plots(_measurements(), PLOT_TYPES, out_dir)
+            return sorted(p.name for p in out_dir.iterdir())
+
+    def test_inline(self):
+        self.assertEqual(self._render(), ["box_plot.png", "histogram.png", "time_series.png"])
+
+    def test_process_pool(self):
+        with mock.patch.object(visualization, "PARALLEL_MIN_MEASUREMENTS", 0):
+            self.assertEqual(self._render(), ["box_plot.png", "histogram.png", "time_series.png"])
+
+    def test_plotters_accept_grouped_series(self):
+        series = visualization._series_by_ammeter(_measurements())
+        self.assertEqual(sorted(series), ["circutor", "entes", "greenlee"])
+        self.assertEqual(series["circutor"].size, 0)
+        with tempfile.TemporaryDirectory() as td:
+            visualization.plot_box(series, Path(td))
+            self.assertTrue((Path(td) / "box_plot.png").exists())
+
+    def test_render_plots_accepts_grouped_series(self):
+        series = visualization._series_by_ammeter(_measurements())
+        with tempfile.TemporaryDirectory() as td:
+            out_dir = Path(td) / "plots"
+            with mock.patch.object(visualization.MeasurementColumns, "from_measurements") as regroup:
+                visualization.render_plots(series, PLOT_TYPES, out_dir)
+            regroup.assert_not_called()
+            self.assertEqual(sorted(p.name for p in out_dir.iterdir()), ["box_plot.png", "histogram.png", "time_series.png"])
+
+
+if __name__ == "__main__":
+    unittest.main()